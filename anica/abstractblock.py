@@ -12,9 +12,7 @@ objects before storing / after loading json files.
 
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from copy import deepcopy, copy
 from enum import Enum
-import itertools
 import math
 import random
 import textwrap
@@ -42,6 +40,8 @@ class Expandable(ABC):
     element that is larger.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_possible_expansions(self):
         """ Return a list of possible expansions for `apply_expansion()`.
@@ -71,6 +71,8 @@ class AbstractFeature(Expandable, ABC):
     `anica.insnfeaturemanager`.
     """
 
+    __slots__ = ()
+
     class SpecialValue(Enum):
         """ Special values for minimal and maximal values that may be used in
         implementations of this interface.
@@ -84,8 +86,23 @@ class AbstractFeature(Expandable, ABC):
     BOTTOM = SpecialValue.BOTTOM
     TOP = SpecialValue.TOP
 
-    @abstractmethod
+    # Implementations need to provide the results of `is_top()` and
+    # `is_bottom()` as `_is_top` and `_is_bottom` attributes. These are
+    # queried on almost every hot path, so they are kept up to date whenever
+    # the state changes instead of being recomputed on each query. There are
+    # deliberately no defaults here, so that a missing flag is an error rather
+    # than a wrong answer.
+
     def __deepcopy__(self, memo):
+        return self.copy()
+
+    @abstractmethod
+    def copy(self) -> "AbstractFeature":
+        """ Return an independent copy of this feature.
+
+        This is what `deepcopy` uses for features, but calling it directly
+        avoids the overhead of the generic `deepcopy` machinery.
+        """
         pass
 
     @abstractmethod
@@ -93,18 +110,26 @@ class AbstractFeature(Expandable, ABC):
         pass
 
     @abstractmethod
+    def state_key(self):
+        """ Return a hashable snapshot of the current state of this feature.
+
+        Two features of the same kind with equal state keys represent the same
+        set of feature values. The key is not affected by later modifications
+        of the feature.
+        """
+        pass
+
     def is_top(self) -> bool:
         """ Return `True` iff this is a maximal object in the partial order of
         possible abstractions for this component.
         """
-        pass
+        return self._is_top
 
-    @abstractmethod
     def is_bottom(self) -> bool:
         """ Return `True` iff this is a minimal object in the partial order of
         possible abstractions for this component.
         """
-        pass
+        return self._is_bottom
 
     @abstractmethod
     def set_to_top(self):
@@ -142,11 +167,27 @@ class EditDistanceAbstractFeature(AbstractFeature):
     set it to TOP otherwise.
     """
 
+    __slots__ = ('top', '_base', 'curr_dist', 'max_dist', '_is_top', '_is_bottom')
+
     def __init__(self, max_dist):
         self.top = False
-        self.base = None
+        self._base = None
         self.curr_dist = 0
         self.max_dist = max_dist
+        self._update_flags()
+
+    @property
+    def base(self):
+        return self._base
+
+    @base.setter
+    def base(self, base):
+        self._base = base
+        self._update_flags()
+
+    def _update_flags(self):
+        self._is_top = self.top
+        self._is_bottom = not self.top and self._base is None
 
     def __eq__(self, other):
         if not isinstance(other, EditDistanceAbstractFeature):
@@ -156,15 +197,21 @@ class EditDistanceAbstractFeature(AbstractFeature):
     def __hash__(self):
         return hash((self.top, self.base, self.curr_dist))
 
+    def state_key(self):
+        return (self.top, self._base, self.curr_dist)
+
     def _normalize(self):
         if not self.top and self.curr_dist > self.max_dist:
             self.set_to_top()
 
-    def __deepcopy__(self, memo):
-        new_one = EditDistanceAbstractFeature(max_dist=self.max_dist)
+    def copy(self):
+        new_one = EditDistanceAbstractFeature.__new__(EditDistanceAbstractFeature)
         new_one.top = self.top
-        new_one.base = self.base # no need to copy at all
+        new_one._base = self._base # no need to copy at all
         new_one.curr_dist = self.curr_dist
+        new_one.max_dist = self.max_dist
+        new_one._is_top = self._is_top
+        new_one._is_bottom = self._is_bottom
         return new_one
 
     def to_json_dict(self):
@@ -179,19 +226,20 @@ class EditDistanceAbstractFeature(AbstractFeature):
     def from_json_dict(json_dict):
         res = EditDistanceAbstractFeature(max_dist=json_dict['max_dist'])
         res.top = json_dict['top']
-        res.base = json_dict['base']
+        res._base = json_dict['base']
         res.curr_dist = json_dict['curr_dist']
+        res._update_flags()
         return res
 
     def __str__(self) -> str:
-        if self.is_top():
+        if self._is_top:
             return "TOP"
-        if self.is_bottom():
+        if self._is_bottom:
             return "BOTTOM"
-        return f"'{self.base}' + at most {self.curr_dist} edits"
+        return f"'{self._base}' + at most {self.curr_dist} edits"
 
     def get_possible_expansions(self):
-        if self.is_top():
+        if self._is_top:
             return []
         return [(self.curr_dist + 1, (0, False))]
 
@@ -199,20 +247,15 @@ class EditDistanceAbstractFeature(AbstractFeature):
         self.curr_dist = expansion
         self._normalize()
 
-    def is_top(self) -> bool:
-        return self.top
-
-    def is_bottom(self) -> bool:
-        return not self.top and self.base is None
-
     def set_to_top(self):
         self.top = True
         self.curr_dist = None
+        self._update_flags()
 
     def subsumes(self, other: AbstractFeature) -> bool:
         assert isinstance(other, EditDistanceAbstractFeature)
         # that's an approximation
-        return self.is_top() or other.is_bottom() or (self.base == other.base
+        return self._is_top or other._is_bottom or (self._base == other._base
                 and self.curr_dist >= other.curr_dist)
 
     def subsumes_feature(self, feature) -> bool:
@@ -221,14 +264,19 @@ class EditDistanceAbstractFeature(AbstractFeature):
     def join(self, feature):
         if feature is None:
             return
-        if self.is_top():
+        if self._is_top:
             return
-        if self.is_bottom():
+        if self._is_bottom:
             self.base = feature
             self.curr_dist = 0
             return
-        if self.base != feature:
-            d = editdistance.eval(self.base, feature)
+        if self._base != feature:
+            if abs(len(self._base) - len(feature)) > self.max_dist:
+                # The edit distance is at least the difference in length, so
+                # this can only end up as TOP.
+                self.set_to_top()
+                return
+            d = editdistance.eval(self._base, feature)
             if d > self.curr_dist:
                 self.curr_dist = d
                 self._normalize()
@@ -247,22 +295,59 @@ class LogUpperBoundAbstractFeature(AbstractFeature):
     Expansions increase `self.val` if it is less than `self.max_ub` or
     set it to TOP otherwise.
     """
+
+    # Internally, BOTTOM and TOP are encoded as plain integers below and above
+    # all valid bounds, so that checks and comparisons are cheap integer
+    # operations. The `val` property translates them to `SpecialValue`s.
+    _BOTTOM_VAL = -1
+
+    __slots__ = ('max_ub', '_top_val', '_val', '_is_top', '_is_bottom')
+
     def __init__(self, max_ub):
-        self.val = AbstractFeature.BOTTOM
         # the upper bound is `self.val**2 - 1` (inclusively)
         self.max_ub = max_ub
+        self._top_val = max_ub + 1
+        self._set_val(self._BOTTOM_VAL)
+
+    def _set_val(self, val):
+        self._val = val
+        self._is_top = val == self._top_val
+        self._is_bottom = val == self._BOTTOM_VAL
+
+    @property
+    def val(self):
+        if self._is_top:
+            return AbstractFeature.TOP
+        if self._is_bottom:
+            return AbstractFeature.BOTTOM
+        return self._val
+
+    @val.setter
+    def val(self, val):
+        if val is AbstractFeature.TOP:
+            val = self._top_val
+        elif val is AbstractFeature.BOTTOM:
+            val = self._BOTTOM_VAL
+        self._set_val(val)
 
     def __eq__(self, other):
         if not isinstance(other, LogUpperBoundAbstractFeature):
             return False
-        return self.val == other.val
+        return self._val == other._val
 
     def __hash__(self):
-        return hash(self.val)
-
-    def __deepcopy__(self, memo):
-        new_one = LogUpperBoundAbstractFeature(max_ub=self.max_ub)
-        new_one.val = self.val
+        return hash(self._val)
+
+    def state_key(self):
+        return self._val
+
+    def copy(self):
+        new_one = LogUpperBoundAbstractFeature.__new__(LogUpperBoundAbstractFeature)
+        new_one.max_ub = self.max_ub
+        new_one._top_val = self._top_val
+        new_one._val = self._val
+        new_one._is_top = self._is_top
+        new_one._is_bottom = self._is_bottom
         return new_one
 
     def to_json_dict(self):
@@ -278,34 +363,29 @@ class LogUpperBoundAbstractFeature(AbstractFeature):
         return res
 
     def __str__(self) -> str:
-        if self.is_top():
+        if self._is_top:
             return "TOP"
-        if self.is_bottom():
+        if self._is_bottom:
             return "BOTTOM"
-        return f"at most {2**self.val - 1}"
+        return f"at most {2**self._val - 1}"
 
     def get_possible_expansions(self):
-        if self.is_top():
+        if self._is_top:
             return []
-        if self.is_bottom() or self.val >= self.max_ub:
+        if self._is_bottom or self._val >= self.max_ub:
             return [(AbstractFeature.TOP, (0, False))]
-        return [(self.val + 1, (0, False))]
+        return [(self._val + 1, (0, False))]
 
     def apply_expansion(self, expansion):
         self.val = expansion
 
-    def is_top(self) -> bool:
-        return self.val == AbstractFeature.TOP
-
-    def is_bottom(self) -> bool:
-        return self.val == AbstractFeature.BOTTOM
-
     def set_to_top(self):
-        self.val = AbstractFeature.TOP
+        self._set_val(self._top_val)
 
     def subsumes(self, other: AbstractFeature) -> bool:
         assert isinstance(other, LogUpperBoundAbstractFeature)
-        return self.is_top() or other.is_bottom() or (self.val >= other.val)
+        # BOTTOM and TOP are encoded as the minimal and maximal values
+        return self._val >= other._val
 
     def subsumes_feature(self, feature) -> bool:
         assert False, "not yet implemented"
@@ -314,15 +394,12 @@ class LogUpperBoundAbstractFeature(AbstractFeature):
         if feature is None:
             self.set_to_top() # TODO this might be inconsistent...
             return
-        if self.is_top():
+        if self._is_top:
             return
         log_feature = math.floor(math.log2(len(feature)) + 1)
-        if self.is_bottom():
-            self.val = log_feature
-        else:
-            self.val = max(self.val, log_feature)
-        if self.val > self.max_ub:
-            self.set_to_top()
+        # this also covers the BOTTOM case, and values exceeding max_ub
+        # become TOP
+        self._set_val(min(max(self._val, log_feature), self._top_val))
         return
 
 
@@ -334,9 +411,21 @@ class SingletonAbstractFeature(AbstractFeature):
     Expansions set it to TOP.
     """
 
+    __slots__ = ('_val', '_is_top', '_is_bottom')
+
     def __init__(self):
         self.val = AbstractFeature.BOTTOM
 
+    @property
+    def val(self):
+        return self._val
+
+    @val.setter
+    def val(self, val):
+        self._val = val
+        self._is_top = val is AbstractFeature.TOP
+        self._is_bottom = val is AbstractFeature.BOTTOM
+
     def __eq__(self, other):
         if not isinstance(other, SingletonAbstractFeature):
             return False
@@ -345,9 +434,14 @@ class SingletonAbstractFeature(AbstractFeature):
     def __hash__(self):
         return hash(self.val)
 
-    def __deepcopy__(self, memo):
-        new_one = SingletonAbstractFeature()
-        new_one.val = self.val # no need to copy at all
+    def state_key(self):
+        return self._val
+
+    def copy(self):
+        new_one = SingletonAbstractFeature.__new__(SingletonAbstractFeature)
+        new_one._val = self._val # no need to copy at all
+        new_one._is_top = self._is_top
+        new_one._is_bottom = self._is_bottom
         return new_one
 
     def to_json_dict(self):
@@ -363,52 +457,47 @@ class SingletonAbstractFeature(AbstractFeature):
         return str(self.val)
 
     def get_possible_expansions(self):
-        if self.is_top():
+        if self._is_top:
             return []
         return [(AbstractFeature.TOP, (0, False))]
 
     def apply_expansion(self, expansion):
         self.val = expansion
 
-    def is_top(self) -> bool:
-        return self.val == AbstractFeature.TOP
-
-    def is_bottom(self) -> bool:
-        return self.val == AbstractFeature.BOTTOM
-
     def get_val(self):
-        if isinstance(self.val, AbstractFeature.SpecialValue):
+        if self._is_top or self._is_bottom:
             return None
         else:
-            return self.val
+            return self._val
 
     def set_to_top(self):
         self.val = AbstractFeature.TOP
 
     def subsumes(self, other: AbstractFeature) -> bool:
         assert isinstance(other, SingletonAbstractFeature)
-        return (self.val == other.val or
-                other.val == AbstractFeature.BOTTOM or
-                self.val == AbstractFeature.TOP)
+        # the flag checks are cheaper than comparing arbitrary values
+        return (self._is_top or
+                other._is_bottom or
+                self._val == other._val)
 
     def subsumes_feature(self, feature) -> bool:
         if feature is None:
             return True
-        if self.is_top():
+        if self._is_top:
             return True
-        if self.is_bottom():
+        if self._is_bottom:
             return False
-        return self.val == feature
+        return self._val == feature
 
     def join(self, feature):
         if feature is None:
             return
-        if self.is_top():
+        if self._is_top:
             return
-        if self.is_bottom():
+        if self._is_bottom:
             self.val = feature
             return
-        if self.val != feature:
+        if self._val != feature:
             self.set_to_top()
         return
 
@@ -418,30 +507,49 @@ class SubSetAbstractFeature(AbstractFeature):
     that are a (non-strict) superset of `self.val`.
 
     Expansions remove an item from `self.val`.
+
+    Non-bottom values are stored as frozensets, so that copies can share them.
     """
+
+    __slots__ = ('_val', '_is_top', '_is_bottom')
+
     def __init__(self):
         self.val = AbstractFeature.BOTTOM
 
+    @property
+    def val(self):
+        return self._val
+
+    @val.setter
+    def val(self, val):
+        self._is_bottom = val is AbstractFeature.BOTTOM
+        if not self._is_bottom:
+            val = frozenset(val)
+        self._val = val
+        self._is_top = not self._is_bottom and len(val) == 0
+
     def __eq__(self, other):
         if not isinstance(other, SubSetAbstractFeature):
             return False
         return self.val == other.val
 
     def __hash__(self):
-        if isinstance(self.val, set):
-            return hash(frozenset(self.val))
-        else:
-            return hash(self.val)
+        return hash(self.state_key())
 
-    def __deepcopy__(self, memo):
-        new_one = SubSetAbstractFeature()
-        new_one.val = copy(self.val) # no need to deepcopy
+    def state_key(self):
+        return self._val
+
+    def copy(self):
+        new_one = SubSetAbstractFeature.__new__(SubSetAbstractFeature)
+        new_one._val = self._val # immutable, can be shared
+        new_one._is_top = self._is_top
+        new_one._is_bottom = self._is_bottom
         return new_one
 
     def to_json_dict(self):
-        if self.is_bottom():
-            return self.val
-        return tuple(self.val)
+        if self._is_bottom:
+            return self._val
+        return tuple(self._val)
 
     @staticmethod
     def from_json_dict(json_dict):
@@ -450,62 +558,62 @@ class SubSetAbstractFeature(AbstractFeature):
             res.val = json_dict
         else:
             assert isinstance(json_dict, list) or isinstance(json_dict, tuple)
-            res.val = set(json_dict)
+            res.val = json_dict
         return res
 
     def get_possible_expansions(self):
-        if self.is_top():
+        if self._is_top:
             return []
-        if self.is_bottom():
+        if self._is_bottom:
             return [(AbstractFeature.TOP, (0, False))]
         res = []
-        for v in self.val:
+        for v in self._val:
             res.append((v, (1, False)))
         return res
 
     def apply_expansion(self, expansion):
-        if expansion == AbstractFeature.TOP:
+        if expansion is AbstractFeature.TOP:
             self.set_to_top()
             return
-        self.val.remove(expansion)
+        assert expansion in self._val
+        self._val = self._val - {expansion}
+        self._is_top = len(self._val) == 0
 
     def __str__(self) -> str:
-        if self.is_bottom():
+        if self._is_bottom:
             return "BOTTOM"
-        if self.is_top():
+        if self._is_top:
             return "TOP"
-        return "{" + ", ".join(sorted(map(str, self.val))) + "}"
-
-    def is_top(self) -> bool:
-        return (not self.is_bottom()) and len(self.val) == 0
-
-    def is_bottom(self) -> bool:
-        return self.val == AbstractFeature.BOTTOM
+        return "{" + ", ".join(sorted(map(str, self._val))) + "}"
 
     def set_to_top(self):
-        self.val = set()
+        self.val = frozenset()
 
     def subsumes(self, other: AbstractFeature) -> bool:
         assert isinstance(other, SubSetAbstractFeature)
-        if other.is_bottom():
+        if other._is_bottom:
             return True
-        if self.is_bottom():
+        if self._is_bottom:
             return False
-        return self.val.issubset(other.val)
+        return self._val.issubset(other._val)
 
     def subsumes_feature(self, feature) -> bool:
         if feature is None:
             return True
-        if self.is_bottom():
+        if self._is_top:
+            return True
+        if self._is_bottom:
             return False
-        return self.val.issubset(set(feature))
+        # issubset takes arbitrary iterables, and sets are used as they are
+        return self._val.issubset(feature)
 
     def join(self, feature):
         if feature is not None:
-            if self.is_bottom():
-                self.val = set(feature)
-            else:
-                self.val.intersection_update(feature)
+            if self._is_bottom:
+                self.val = feature
+            elif not self._is_top:
+                self._val = self._val.intersection(feature)
+                self._is_top = len(self._val) == 0
 
 
 class SubSetOrDefinitelyNotAbstractFeature(AbstractFeature):
@@ -546,6 +654,8 @@ class SubSetOrDefinitelyNotAbstractFeature(AbstractFeature):
                                      +--------+
     """
 
+    __slots__ = ('subfeature', 'is_in_subfeature')
+
     def __init__(self):
         self.subfeature = SubSetAbstractFeature()
 
@@ -559,10 +669,13 @@ class SubSetOrDefinitelyNotAbstractFeature(AbstractFeature):
     def __hash__(self):
         return hash((self.subfeature, self.is_in_subfeature))
 
-    def __deepcopy__(self, memo):
-        new_one = self.__class__()
-        new_one.subfeature = deepcopy(self.subfeature, memo)
-        new_one.is_in_subfeature = deepcopy(self.is_in_subfeature, memo)
+    def state_key(self):
+        return (self.subfeature.state_key(), self.is_in_subfeature.state_key())
+
+    def copy(self):
+        new_one = self.__class__.__new__(self.__class__)
+        new_one.subfeature = self.subfeature.copy()
+        new_one.is_in_subfeature = self.is_in_subfeature.copy()
         return new_one
 
     def to_json_dict(self):
@@ -579,36 +692,46 @@ class SubSetOrDefinitelyNotAbstractFeature(AbstractFeature):
         return res
 
     def get_possible_expansions(self):
-        if self.is_top():
+        in_sub = self.is_in_subfeature
+        if in_sub._is_top:
             return []
-        if self.is_bottom() or self.is_in_subfeature.val == False or self.subfeature.is_top():
+        if in_sub._is_bottom or in_sub._val is False or self.subfeature._is_top:
             return [(AbstractFeature.TOP, (0, False))]
 
         return self.subfeature.get_possible_expansions()
 
     def apply_expansion(self, expansion):
-        if expansion == AbstractFeature.TOP:
+        if expansion is AbstractFeature.TOP:
             self.set_to_top()
             return
         self.subfeature.apply_expansion(expansion)
 
     def __str__(self) -> str:
-        if self.is_bottom():
+        in_sub = self.is_in_subfeature
+        if in_sub._is_bottom:
             return "BOTTOM"
-        if self.is_top():
+        if in_sub._is_top:
             return "TOP"
-        if self.is_in_subfeature.val == True:
-            if self.subfeature.is_top():
+        if in_sub._val is True:
+            if self.subfeature._is_top:
                 return "definitely something"
             return "at least " + str(self.subfeature)
-        assert self.is_in_subfeature.val == False
+        assert in_sub._val is False
         return "definitely not"
 
-    def is_top(self) -> bool:
-        return self.is_in_subfeature.is_top()
+    # The state of this feature is entirely determined by its components (that
+    # might be modified directly), so we forward their cached flags instead of
+    # maintaining our own. The methods below read the components' internal
+    # state directly rather than going through their methods, since this
+    # feature is queried very often in the aliasing and subsumption checks.
 
-    def is_bottom(self) -> bool:
-        return self.is_in_subfeature.is_bottom()
+    @property
+    def _is_top(self):
+        return self.is_in_subfeature._is_top
+
+    @property
+    def _is_bottom(self):
+        return self.is_in_subfeature._is_bottom
 
     def set_to_top(self):
         self.is_in_subfeature.set_to_top()
@@ -616,46 +739,60 @@ class SubSetOrDefinitelyNotAbstractFeature(AbstractFeature):
 
     def subsumes(self, other: AbstractFeature) -> bool:
         assert isinstance(other, self.__class__)
-        if other.is_bottom():
+        in_sub = self.is_in_subfeature
+        other_in_sub = other.is_in_subfeature
+        if other_in_sub._is_bottom:
             return True
-        if self.is_bottom():
+        if in_sub._is_bottom:
             return False
-        if self.is_top():
+        if in_sub._is_top:
             return True
-        if other.is_top():
+        if other_in_sub._is_top:
             return False
 
-        if self.is_in_subfeature.val == False:
-            return other.is_in_subfeature.val == False
+        if in_sub._val is False:
+            return other_in_sub._val is False
 
-        if self.is_in_subfeature.val == True and other.is_in_subfeature.val == False:
+        if other_in_sub._val is False:
             return False
 
-        assert self.is_in_subfeature.val == True and other.is_in_subfeature.val == True
+        assert in_sub._val is True and other_in_sub._val is True
 
-        return self.subfeature.subsumes(other.subfeature)
+        sub = self.subfeature
+        other_sub = other.subfeature
+        if other_sub._is_bottom:
+            return True
+        if sub._is_bottom:
+            return False
+        return sub._val.issubset(other_sub._val)
 
     def subsumes_feature(self, feature) -> bool:
         if feature is None:
             return True
-        if self.is_bottom():
+        in_sub = self.is_in_subfeature
+        if in_sub._is_bottom:
             return False
-        if self.is_top():
+        if in_sub._is_top:
             return True
 
-        if self.is_in_subfeature.val == False:
+        if in_sub._val is False:
             return len(feature) == 0
 
-        return self.subfeature.subsumes_feature(feature)
+        sub = self.subfeature
+        if sub._is_bottom:
+            return False
+        return sub._val.issubset(feature)
 
     def join(self, feature):
-        if feature is not None:
-            if len(feature) == 0:
-                self.is_in_subfeature.join(False)
-                self.subfeature.set_to_top()
-            else:
-                self.is_in_subfeature.join(True)
-                self.subfeature.join(feature)
+        if feature is None:
+            return
+        in_sub = self.is_in_subfeature
+        if len(feature) == 0:
+            in_sub.join(False)
+            self.subfeature.set_to_top()
+        else:
+            in_sub.join(True)
+            self.subfeature.join(feature)
 
 class AbstractInsn(Expandable):
     """ An instance of this class represents a set of (concrete) `InsnScheme`s
@@ -666,21 +803,48 @@ class AbstractInsn(Expandable):
     `self.features`.
     """
 
+    # There are lots of these objects, so we save the instance dicts.
+    __slots__ = ('actx', 'features', '_feasible_schemes_cache', '_expansions_cache')
+
     def __init__(self, actx: "AbstractionContext"):
         self.actx = actx
         self.features = actx.insn_feature_manager.init_abstract_features()
 
+        # A triple of a state key of the features and the feasible InsnSchemes
+        # for this state (as a frozenset and as a tuple for indexing), to avoid
+        # recomputing them when sampling repeatedly from an unchanged
+        # AbstractInsn.
+        self._feasible_schemes_cache = None
+
+        # A pair of a state key of the features and the possible expansions
+        # (with their benefits) in this state. Computing the benefits is
+        # expensive, and generalization asks for the expansions of unchanged
+        # AbstractInsns over and over.
+        self._expansions_cache = None
+
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, AbstractInsn):
             return False
-        return self.features == other.features
+        return self.state_key() == other.state_key()
 
     def __hash__(self):
-        return hash(frozenset(self.features.items()))
+        return hash(self.state_key())
 
     def __deepcopy__(self, memo):
-        new_one = AbstractInsn(self.actx)
-        new_one.features = deepcopy(self.features, memo)
+        return self.copy()
+
+    def copy(self) -> "AbstractInsn":
+        """ Return an independent copy of this `AbstractInsn`.
+        """
+        new_one = AbstractInsn.__new__(AbstractInsn)
+        new_one.actx = self.actx
+        new_one.features = { k: v.copy() for k, v in self.features.items() }
+        # The cache entries are immutable and checked against the state key,
+        # so they can be shared.
+        new_one._feasible_schemes_cache = self._feasible_schemes_cache
+        new_one._expansions_cache = self._expansions_cache
         return new_one
 
     def to_json_dict(self):
@@ -695,14 +859,15 @@ class AbstractInsn(Expandable):
         init_features = res.features
         assert set(init_features.keys()) == set(json_dict.keys())
         json_features = dict()
-        for k, v in json_dict.items():
-            cls = type(init_features[k])
-            json_features[k] = cls.from_json_dict(v)
+        # keep the order of the initial features, state keys depend on it
+        for k, init_feature in init_features.items():
+            cls = type(init_feature)
+            json_features[k] = cls.from_json_dict(json_dict[k])
         res.features = json_features
         return res
 
     def __str__(self) -> str:
-        if all(map(lambda x: x[1].is_top(), self.features.items())):
+        if self.is_top():
             return "TOP"
         return "\n".join((f"{k}: {v}" for k, v in self.features.items()))
 
@@ -711,7 +876,16 @@ class AbstractInsn(Expandable):
             v.set_to_top()
 
     def is_top(self):
-        return all(map(lambda x: x[1].is_top(), self.features.items()))
+        for v in self.features.values():
+            if not v.is_top():
+                return False
+        return True
+
+    def is_bottom(self):
+        """ Check whether self represents no InsnScheme, i.e., the
+        instruction is not present.
+        """
+        return all(v._is_bottom for v in self.features.values())
 
     def compute_benefit(self, expansion):
         """ Compute the increase in fitting insn schemes if we would apply this
@@ -720,18 +894,25 @@ class AbstractInsn(Expandable):
         This should always be >= 1 (since expansions should only expand, i.e.
         allow for more insn schemes).
         """
-        num_prev_feasible_schemes = len(self.actx.insn_feature_manager.compute_feasible_schemes(self.features))
+        num_prev_feasible_schemes = len(self.get_feasible_schemes())
 
         assert num_prev_feasible_schemes > 0, "Computing benefit for an AbstractInsn without feasible schemes!"
 
-        absfeature_dict = { k: v for k, v in self.features.items() }
+        features = self.features
 
         replace_k, inner_expansion = expansion
-        replace_feature = deepcopy(self.features[replace_k])
+        orig_feature = features[replace_k]
+        replace_feature = orig_feature.copy()
         replace_feature.apply_expansion(inner_expansion)
-        absfeature_dict[replace_k] = replace_feature
 
-        feasible_schemes = self.actx.insn_feature_manager.compute_feasible_schemes(absfeature_dict)
+        # Instead of building a modified copy of the feature dict, we swap the
+        # expanded feature in temporarily.
+        features[replace_k] = replace_feature
+        try:
+            feasible_schemes = self.actx.insn_feature_manager.get_feasible_schemes(features)
+        finally:
+            features[replace_k] = orig_feature
+
         num_feasible_schemes = len(feasible_schemes)
 
         definitely_does_not_change = (num_prev_feasible_schemes == num_feasible_schemes)
@@ -739,8 +920,16 @@ class AbstractInsn(Expandable):
         return len(feasible_schemes) / num_prev_feasible_schemes, definitely_does_not_change
 
     def get_possible_expansions(self):
+        key = self.state_key()
+        cached = self._expansions_cache
+        if cached is None or cached[0] != key:
+            cached = (key, tuple(self._compute_possible_expansions()))
+            self._expansions_cache = cached
+        return list(cached[1])
+
+    def _compute_possible_expansions(self):
         exact_scheme_entry = self.features.get('exact_scheme', None)
-        if exact_scheme_entry is not None and not exact_scheme_entry.is_top():
+        if exact_scheme_entry is not None and not exact_scheme_entry._is_top:
             # The exact scheme is more specific than the other features (it
             # implies all of them). It is therefore pointless and harmful to
             # expand another feature first, as it will not affect the sampling
@@ -755,11 +944,43 @@ class AbstractInsn(Expandable):
             benefit  = self.compute_benefit(expansion)
             return [(expansion, benefit)]
 
+        ifm = self.actx.insn_feature_manager
+        indexed_keys = ifm.index_order
+        num_prev_feasible_schemes = None
+
         res = []
         for key, af in self.features.items():
-            for inner_expansion, benefit in af.get_possible_expansions():
+            if af._is_top:
+                # TOP features cannot be expanded any further
+                continue
+            inner_expansions = af.get_possible_expansions()
+            if len(inner_expansions) == 0:
+                continue
+
+            if key not in indexed_keys:
+                for inner_expansion, benefit in inner_expansions:
+                    expansion = (key, inner_expansion)
+                    benefit = self.compute_benefit(expansion)
+                    res.append((expansion, benefit))
+                continue
+
+            # This is equivalent to calling compute_benefit for each
+            # expansion, but the constraints from the other features, which
+            # are the same for all expansions of this feature, are only
+            # evaluated once.
+            if num_prev_feasible_schemes is None:
+                num_prev_feasible_schemes = len(self.get_feasible_schemes())
+                assert num_prev_feasible_schemes > 0, "Computing benefit for an AbstractInsn without feasible schemes!"
+            others_feasible_schemes = ifm.get_feasible_schemes(self.features, ignored_key=key)
+
+            for inner_expansion, benefit in inner_expansions:
                 expansion = (key, inner_expansion)
-                benefit = self.compute_benefit(expansion)
+                replace_feature = af.copy()
+                replace_feature.apply_expansion(inner_expansion)
+                feasible_schemes = ifm.restrict_feasible_schemes(others_feasible_schemes, key, replace_feature)
+                num_feasible_schemes = len(feasible_schemes)
+                benefit = (num_feasible_schemes / num_prev_feasible_schemes,
+                        num_prev_feasible_schemes == num_feasible_schemes)
                 res.append((expansion, benefit))
         return res
 
@@ -767,12 +988,39 @@ class AbstractInsn(Expandable):
         key, inner_expansion = expansion
         self.features[key].apply_expansion(inner_expansion)
 
+    def copy_with_expansion(self, expansion) -> "AbstractInsn":
+        """ Return a copy of `self` with the `expansion` applied.
+
+        Only the expanded feature is copied, the others are shared with
+        `self`.
+        """
+        key, inner_expansion = expansion
+        new_one = AbstractInsn.__new__(AbstractInsn)
+        new_one.actx = self.actx
+        features = dict(self.features)
+        expanded_feature = features[key].copy()
+        expanded_feature.apply_expansion(inner_expansion)
+        features[key] = expanded_feature
+        new_one.features = features
+        new_one._feasible_schemes_cache = self._feasible_schemes_cache
+        new_one._expansions_cache = self._expansions_cache
+        return new_one
+
     def subsumes(self, other: "AbstractInsn") -> bool:
         """ Check if all concrete instruction instances represented by `other`
         are also represented by `self`.
         """
+        other_features = other.features
+        if self is other or self.features is other_features:
+            return True
+
         for k, abs_feature in self.features.items():
-            other_feature = other.features[k]
+            if abs_feature._is_top:
+                # TOP subsumes everything, no need to look at the other side
+                continue
+            other_feature = other_features[k]
+            if abs_feature is other_feature:
+                continue
             if not abs_feature.subsumes(other_feature):
                 return False
 
@@ -792,6 +1040,34 @@ class AbstractInsn(Expandable):
         for k, v in insn_features.items():
             self.features[k].join(v)
 
+    def state_key(self):
+        """ Return a hashable snapshot of the current state of all features.
+
+        Two `AbstractInsn`s are equal iff their state keys are equal.
+        """
+        return tuple(v.state_key() for v in self.features.values())
+
+    def _get_feasible_schemes_entry(self):
+        key = self.state_key()
+        cached = self._feasible_schemes_cache
+        if cached is None or cached[0] != key:
+            feasible_schemes = self.actx.insn_feature_manager.get_feasible_schemes(self.features)
+            cached = (key, feasible_schemes, tuple(feasible_schemes))
+            self._feasible_schemes_cache = cached
+        return cached
+
+    def get_feasible_schemes(self) -> frozenset:
+        """ Return a frozenset of all `InsnScheme`s represented by this
+        abstract instruction.
+
+        The result is cached for as long as the features do not change.
+        """
+        return self._get_feasible_schemes_entry()[1]
+
+    # How often `sample` draws from all feasible schemes before it removes the
+    # blacklisted ones explicitly.
+    num_rejection_attempts = 8
+
     def sample(self, insn_scheme_blacklist: Sequence[iwho.InsnScheme]=[]) -> iwho.InsnScheme:
         """ Randomly choose one from the set of concrete instruction schemes
         represented by this abstract instruction.
@@ -800,13 +1076,27 @@ class AbstractInsn(Expandable):
 
         Raises a `SampingError` if sampling fails.
         """
-        feasible_schemes = self.actx.insn_feature_manager.compute_feasible_schemes(self.features)
-
-        feasible_schemes.difference_update(insn_scheme_blacklist)
-
-        if len(feasible_schemes) == 0:
-            raise SamplingError(f"No InsnScheme is feasible for AbstractInsn {self}")
-        return random.choice(tuple(feasible_schemes))
+        feasible_tuple = self._get_feasible_schemes_entry()[2]
+
+        num_feasible = len(feasible_tuple)
+        if num_feasible > 0:
+            # Rejection sampling avoids building a filtered copy of the
+            # feasible schemes. It is cheap if the blacklist only excludes a
+            # small portion of them, which is the common case.
+            for i in range(self.num_rejection_attempts):
+                scheme = feasible_tuple[random.randrange(num_feasible)]
+                if scheme not in insn_scheme_blacklist:
+                    return scheme
+
+            # Filter the cached tuple in a single pass rather than building a
+            # set difference and then a tuple from it.
+            if not isinstance(insn_scheme_blacklist, (set, frozenset)):
+                insn_scheme_blacklist = set(insn_scheme_blacklist)
+            feasible_schemes = [ s for s in feasible_tuple if s not in insn_scheme_blacklist ]
+            if len(feasible_schemes) > 0:
+                return feasible_schemes[random.randrange(len(feasible_schemes))]
+
+        raise SamplingError(f"No InsnScheme is feasible for AbstractInsn {self}")
 
     def precompute_sampler(self, insn_scheme_blacklist: Sequence[iwho.InsnScheme]=[]):
         """ Compute the common expensive components to `sample` and return a
@@ -816,50 +1106,78 @@ class AbstractInsn(Expandable):
         Using this is a good idea if you want to sample several times from the
         same `AbstractInsn`.
         """
-        feasible_schemes = self.actx.insn_feature_manager.compute_feasible_schemes(self.features)
-        feasible_schemes.difference_update(insn_scheme_blacklist)
+        feasible_schemes = self.get_feasible_schemes().difference(insn_scheme_blacklist)
 
         if len(feasible_schemes) == 0:
             raise SamplingError(f"No InsnScheme is feasible for AbstractInsn {self}")
         return PrecomputedSamplerAbsInsn(feasible_schemes)
 
-def _lists2tuples(obj):
-    if isinstance(obj, list) or isinstance(obj, tuple):
-        return tuple(( _lists2tuples(x) for x in obj ))
-    return obj
 
+class _UnionFind:
+    """ A disjoint-set data structure over the integers 0, 1, 2, ... with path
+    halving and union by rank.
 
-def _transitive_closure(same):
-    """ Expand the symmetric relation implied by `same` to its transitive
-    closure.
-
-    `same` is expected to be a dictionary mapping things X to sets of different
-    things that are related to X.
-    It needs to be symmetric, so whenever an entry `X -> {..., Y, ...}` is in
-    the dictionary, there needs to be an inverse entry `Y -> {..., X, ...}`.
+    The range of elements grows implicitly when larger elements are used.
     """
-    total_steps = 0
-    for k in same.keys():
-        entries_for_k = set(same[k])
-        entries_for_k.add(k)
-        worklist = list(same[k])
-        while len(worklist) > 0:
-            curr = worklist.pop(0)
 
-            # get elements that are in relation to curr, but not yet in the set for k
-            additional_entries = same[curr] - entries_for_k
+    __slots__ = ('parent', 'rank')
 
-            # add those that are not yet in the worklist
-            additional_entries.difference_update(worklist)
-            worklist += additional_entries
+    def __init__(self, size=0):
+        self.parent = list(range(size))
+        self.rank = [0] * size
 
-            # also add them to the elements for k (those previously in the worklist are in here anyway)
-            entries_for_k.update(additional_entries)
-            total_steps += 1
+    def _grow(self, x):
+        old_size = len(self.parent)
+        self.parent.extend(range(old_size, x + 1))
+        self.rank.extend([0] * (x + 1 - old_size))
 
-        entries_for_k.discard(k)
-        same[k] = entries_for_k
-    logger.debug(f"total transitive closure steps: {total_steps}")
+    def find(self, x):
+        """ Return the representative of the set containing `x`.
+        """
+        parent = self.parent
+        if x >= len(parent):
+            self._grow(x)
+            return x
+
+        # path halving: a single pass that keeps the trees flat
+        px = parent[x]
+        while px != x:
+            ppx = parent[px]
+            parent[x] = ppx
+            x = px
+            px = ppx
+
+        return x
+
+    def union(self, x, y):
+        """ Merge the sets containing `x` and `y` and return the
+        representative of the result.
+        """
+        rx = self.find(x)
+        ry = self.find(y)
+        if rx == ry:
+            return rx
+        rank = self.rank
+        if rank[rx] < rank[ry]:
+            rx, ry = ry, rx
+        self.parent[ry] = rx
+        if rank[rx] == rank[ry]:
+            rank[rx] += 1
+        return rx
+
+    def classes(self):
+        """ Return a mapping from representatives to the sets of elements that
+        they represent.
+        """
+        res = defaultdict(set)
+        parent = self.parent
+        find = self.find
+        for x, px in enumerate(parent):
+            if parent[px] != px:
+                # x is neither a root nor a direct child of one
+                px = find(x)
+            res[px].add(x)
+        return res
 
 
 class AbstractAliasInfo(Expandable):
@@ -870,6 +1188,16 @@ class AbstractAliasInfo(Expandable):
     `AbstractBlock` and an operand index for that `AbstractInsn`.
     """
 
+    __slots__ = ('actx', '_aliasing_dict', 'is_bot')
+
+    # How often sampling operands may undo earlier choices to resolve a
+    # conflict before it gives up.
+    max_backjumps = 16
+
+    # How often an operand is drawn from all allowed operands of its scheme
+    # before the remaining options are collected explicitly.
+    num_rejection_attempts = 4
+
     def __init__(self, actx):
         self.actx = actx
 
@@ -892,12 +1220,33 @@ class AbstractAliasInfo(Expandable):
         self.is_bot = True
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, AbstractAliasInfo):
             return False
-        return self.is_bot == other.is_bot and self._aliasing_dict == other._aliasing_dict
+        if self.is_bot != other.is_bot:
+            return False
+        self_dict = self._aliasing_dict
+        other_dict = other._aliasing_dict
+        if len(self_dict) != len(other_dict):
+            return False
+        # compare the plain values rather than going through the __eq__ of
+        # every SingletonAbstractFeature
+        for k, sv in self_dict.items():
+            ov = other_dict.get(k, None)
+            if ov is None or sv._val != ov._val:
+                return False
+        return True
 
     def __hash__(self):
-        return hash((self.is_bot, frozenset(self._aliasing_dict.items())))
+        return hash(self.state_key())
+
+    def state_key(self):
+        """ Return a hashable snapshot of the current aliasing state.
+
+        Two `AbstractAliasInfo`s are equal iff their state keys are equal.
+        """
+        return (self.is_bot, frozenset((k, v._val) for k, v in self._aliasing_dict.items()))
 
     def to_json_dict(self):
         res = dict()
@@ -909,16 +1258,28 @@ class AbstractAliasInfo(Expandable):
     def from_json_dict(actx, json_dict):
         res = AbstractAliasInfo(actx)
         aliasing = dict()
-        for k, v in json_dict['aliasing_dict']:
-            key = _lists2tuples(k)
+        # Keys are pairs of (insn index, operand key) pairs, which come out of
+        # json as nested lists. Operand keys are flat sequences, so there is no
+        # need for a general recursive conversion.
+        for ((iidx1, op_key1), (iidx2, op_key2)), v in json_dict['aliasing_dict']:
+            if isinstance(op_key1, list):
+                op_key1 = tuple(op_key1)
+            if isinstance(op_key2, list):
+                op_key2 = tuple(op_key2)
+            key = ((iidx1, op_key1), (iidx2, op_key2))
             aliasing[key] = SingletonAbstractFeature.from_json_dict(v)
         res._aliasing_dict = aliasing
         res.is_bot = json_dict['is_bot']
         return res
 
     def __deepcopy__(self, memo):
+        return self.copy()
+
+    def copy(self) -> "AbstractAliasInfo":
+        """ Return an independent copy of this `AbstractAliasInfo`.
+        """
         new_one = AbstractAliasInfo(self.actx)
-        new_one._aliasing_dict = { k: deepcopy(v, memo) for k, v in self._aliasing_dict.items() } # no need to duplicate the keys here
+        new_one._aliasing_dict = { k: v.copy() for k, v in self._aliasing_dict.items() } # no need to duplicate the keys here
         new_one.is_bot = self.is_bot
         return new_one
 
@@ -939,12 +1300,27 @@ class AbstractAliasInfo(Expandable):
         av = self._aliasing_dict[key]
         av.apply_expansion(inner_expansion)
 
+    def copy_with_expansion(self, expansion) -> "AbstractAliasInfo":
+        """ Return a copy of `self` with the `expansion` applied.
+
+        Only the expanded entry is copied, the others are shared with `self`.
+        """
+        key, inner_expansion = expansion
+        new_one = AbstractAliasInfo(self.actx)
+        aliasing_dict = dict(self._aliasing_dict)
+        expanded_entry = aliasing_dict[key].copy()
+        expanded_entry.apply_expansion(inner_expansion)
+        aliasing_dict[key] = expanded_entry
+        new_one._aliasing_dict = aliasing_dict
+        new_one.is_bot = self.is_bot
+        return new_one
+
     def get_component(self, idx1, idx2):
         """ Obtain (and create if necessary) an AbstractFeature for the given
         pair of instruction/operand indices. The order of idx1 and idx2 does
         not matter.
         """
-        key = tuple(sorted((idx1, idx2)))
+        key = (idx1, idx2) if idx1 <= idx2 else (idx2, idx1)
         res = self._aliasing_dict.get(key, None)
         if res is None and self.is_bot:
             res = SingletonAbstractFeature()
@@ -957,13 +1333,23 @@ class AbstractAliasInfo(Expandable):
         """
         if self.is_bot:
             return
-        new_aliasing = { k: v  for k, v in self._aliasing_dict.items() if not v.is_top() }
-        self._aliasing_dict = new_aliasing
+        aliasing_dict = self._aliasing_dict
+        top_keys = [ k for k, v in aliasing_dict.items() if v._is_top ]
+        if len(top_keys) == 0:
+            # the common case, e.g. right after the first join
+            return
+        if 2 * len(top_keys) > len(aliasing_dict):
+            # Deleting most entries would leave a sparse dict behind that is
+            # still as slow to iterate as the full one.
+            self._aliasing_dict = { k: v  for k, v in aliasing_dict.items() if not v._is_top }
+            return
+        for k in top_keys:
+            del aliasing_dict[k]
 
     def __str__(self) -> str:
         entries = []
         for ((iidx1, oidx1), (iidx2,oidx2)), absval in self._aliasing_dict.items():
-            if absval.is_top():
+            if absval._is_top:
                 # skip TOP entries, as they make the output quite large
                 continue
             elif absval.is_bottom():
@@ -991,11 +1377,15 @@ class AbstractAliasInfo(Expandable):
             return False
 
         # all items not present are considered TOP and subsume everything
+        other_dict = other._aliasing_dict
         for k, sv in self._aliasing_dict.items():
-            if sv.is_top():
+            if sv._is_top:
                 continue
-            ov = other._aliasing_dict.get(k, None)
-            if ov is None or not sv.subsumes(ov):
+            ov = other_dict.get(k, None)
+            if ov is None:
+                return False
+            # this is SingletonAbstractFeature.subsumes, inlined
+            if not (sv._val == ov._val or ov._is_bottom):
                 return False
 
         return True
@@ -1006,58 +1396,166 @@ class AbstractAliasInfo(Expandable):
         """
         bb_insns = list(bb.insns)
 
-        # identify all operand indices in bb that we care about
+        iwho_aug = self.actx.iwho_augmentation
+        aliasing_operand_keys = iwho_aug.aliasing_operand_keys
+        is_compatible = iwho_aug.is_compatible
+        alias_state = iwho_aug.alias_state
+        aliasing_dict = self._aliasing_dict
+        is_bot = self.is_bot
+
+        # identify all operand indices in bb that we care about, together with
+        # their operand schemes
         all_indices = []
         for insn_idx, ii in enumerate(bb_insns):
             if ii is None:
                 continue
-            for operand, (op_key, op_scheme) in ii.get_operands():
-                if self.actx.iwho_augmentation.skip_for_aliasing(op_scheme):
-                    continue
+            for op_key, op_scheme in aliasing_operand_keys(ii.scheme):
                 idx = (insn_idx, op_key)
-                all_indices.append((idx, operand))
-
-        # for each combination of such operand indices, update the
-        # corresponding entry in the dict
-        for (idx1, op1), (idx2, op2) in itertools.combinations(all_indices, 2):
-            ad = self.get_component(idx1, idx2)
-            if ad is None or ad.is_top():
-                continue
+                all_indices.append((idx, ii.get_operand(op_key), op_scheme))
+
+        # keys of entries that went to TOP, we don't need them in the dict
+        # (once self is not BOTTOM anymore)
+        top_keys = []
+
+        # entries for pairs of operands that are not in the dict yet
+        new_entries = []
+
+        if is_bot and len(aliasing_dict) == 0:
+            # For the first join into an empty abstraction, only pairs of
+            # compatible operands can lead to entries. We group the operands
+            # by their alias classes and only combine groups that are
+            # compatible with each other.
+            all_indices.sort(key=lambda x: x[0])
+
+            alias_classes = iwho_aug.alias_classes
+            groups = defaultdict(list)
+            for pos, (idx, operand, op_scheme) in enumerate(all_indices):
+                groups[alias_classes(op_scheme)].append(pos)
+            group_list = list(groups.items())
+
+            pair_positions = []
+            for gpos, (classes1, positions1) in enumerate(group_list):
+                if len(classes1) == 0:
+                    continue
+                num_positions1 = len(positions1)
+                for i in range(num_positions1):
+                    pos1 = positions1[i]
+                    for j in range(i + 1, num_positions1):
+                        pair_positions.append((pos1, positions1[j]))
+                for classes2, positions2 in group_list[gpos + 1:]:
+                    if classes1.isdisjoint(classes2):
+                        continue
+                    for pos1 in positions1:
+                        for pos2 in positions2:
+                            if pos1 < pos2:
+                                pair_positions.append((pos1, pos2))
+                            else:
+                                pair_positions.append((pos2, pos1))
+
+            # keep the order of keys that the full enumeration would produce
+            pair_positions.sort()
+
+            # All of these pairs are compatible and new, so we can directly
+            # compute their entries, which are only created if not TOP.
+            for pos1, pos2 in pair_positions:
+                idx1, op1, op_scheme1 = all_indices[pos1]
+                idx2, op2, op_scheme2 = all_indices[pos2]
+                val = alias_state(op1, op2)
+                if val is None:
+                    continue
+                ad = SingletonAbstractFeature()
+                ad.val = val
+                new_entries.append(((idx1, idx2), ad))
+
+            # there are no existing entries to update
+            pairs = ()
+        elif is_bot:
+            # For the first join, we need to consider each combination of
+            # operand indices.
+            # With sorted indices, the combinations are already ordered like
+            # the keys of the aliasing dict.
+            all_indices.sort(key=lambda x: x[0])
+
+            def get_pairs():
+                # The first operand of a pair is unpacked only once for all its
+                # partners.
+                for pos, (idx1, op1, op_scheme1) in enumerate(all_indices, 1):
+                    for idx2, op2, op_scheme2 in all_indices[pos:]:
+                        key = (idx1, idx2)
+                        ad = aliasing_dict.get(key, None)
+                        if ad is None:
+                            # new entries are only added if they are not TOP
+                            ad = SingletonAbstractFeature()
+                            yield key, ad, True, op1, op_scheme1, op2, op_scheme2
+                        elif not ad._is_top:
+                            yield key, ad, False, op1, op_scheme1, op2, op_scheme2
+            pairs = get_pairs()
+        else:
+            # Afterwards, entries that are not present are TOP and stay TOP,
+            # so it suffices to update the present entries.
+            operand_infos = { idx: (operand, op_scheme) for idx, operand, op_scheme in all_indices }
+
+            def get_pairs():
+                for key, ad in aliasing_dict.items():
+                    if ad._is_top:
+                        top_keys.append(key)
+                        continue
+                    idx1, idx2 = key
+                    info1 = operand_infos.get(idx1, None)
+                    info2 = operand_infos.get(idx2, None)
+                    if info1 is None or info2 is None:
+                        continue
+                    yield key, ad, False, info1[0], info1[1], info2[0], info2[1]
+            pairs = get_pairs()
 
+        # update the entry for each relevant pair of operands
+        for key, ad, is_new, op1, op_scheme1, op2, op_scheme2 in pairs:
             # if operand schemes are not compatible, this entry is ignored
-            op_scheme1 = bb_insns[idx1[0]].scheme.get_operand_scheme(idx1[1])
-            op_scheme2 = bb_insns[idx2[0]].scheme.get_operand_scheme(idx2[1])
-            if not self.actx.iwho_augmentation.is_compatible(op_scheme1, op_scheme2):
-                if ad.is_bottom():
+            if not is_compatible(op_scheme1, op_scheme2):
+                if ad._is_bottom:
                     # This is to avoid bottom entries for incompatible operand
                     # combinations when initializing. Those would not be
                     # unsound, but they are pointless and cause work.
                     ad.set_to_top()
+                    if not is_new:
+                        top_keys.append(key)
                 continue
 
-            if self.actx.iwho_augmentation.must_alias(op1, op2):
-                ad.join(True)
-            elif not self.actx.iwho_augmentation.may_alias(op1, op2):
-                ad.join(False)
-            else:
+            val = alias_state(op1, op2)
+            if val is None:
                 ad.set_to_top()
+            else:
+                ad.join(val)
+
+            if ad._is_top:
+                if not is_new:
+                    top_keys.append(key)
+            elif is_new:
+                new_entries.append((key, ad))
+
+        aliasing_dict.update(new_entries)
 
         # if this is the first join, this switches the interpretation of
         # non-present entries in the abs_aliasing dict.
         self.is_bot = False
 
-        # components could have gone to TOP, we don't need them in the dict
-        self.do_compaction()
+        for key in top_keys:
+            del aliasing_dict[key]
+
+        if is_bot:
+            # There might have been TOP components before that we did not
+            # touch here.
+            self.do_compaction()
 
     def is_top(self):
-        return (not self.is_bot) and all(map(lambda x: x[1].is_top(), self._aliasing_dict.items()))
+        return (not self.is_bot) and all(v._is_top for v in self._aliasing_dict.values())
 
     def havoc(self):
         """Clear all constraints."""
         self.is_bot = False
         self._aliasing_dict = dict()
 
-    def _compute_partitions(self, insn_schemes: Sequence[iwho.InsnScheme]):
+    def _compute_partitions(self, insn_schemes: Sequence[iwho.InsnScheme], op_scheme_table=None):
         """ Extract aliasing constraints into a more workable form.
 
         Returns two mappings from op_indices to sets of op_indices: (same, not_same)
@@ -1065,57 +1563,141 @@ class AbstractAliasInfo(Expandable):
             operands with which they should alias
           - not_same is a mapping from instruction operands to sets of
             instruction operands with which they should not alias
+        Operands without such constraints have no entries.
+
+        `op_scheme_table` can be a mapping from op_indices to the operand
+        schemes of insn_schemes, as computed by `_compute_op_scheme_table`.
 
         Helper function for sampling.
         """
-        same = defaultdict(set)
-        not_same = defaultdict(set)
+        if op_scheme_table is None:
+            op_scheme_table = self._compute_op_scheme_table(insn_schemes)
+
+        # operands that should alias form equivalence classes, which we
+        # collect in a union-find structure
+        uf = _UnionFind()
+        not_same_pairs = []
+
+        # Operands are identified by consecutive small integers in here, which
+        # are cheaper to hash and compare than the nested operand index tuples
+        # and allow for an array-based union-find structure.
+        op_ids = dict()
+        op_refs = []
+        def get_op_id(insn_op):
+            res = op_ids.get(insn_op, None)
+            if res is None:
+                res = len(op_refs)
+                op_ids[insn_op] = res
+                op_refs.append(insn_op)
+            return res
+
+        iwho_aug = self.actx.iwho_augmentation
+        skip_for_aliasing = iwho_aug.skip_for_aliasing
+        is_compatible = iwho_aug.is_compatible
 
         for (insn_op1, insn_op2), should_alias in self._aliasing_dict.items():
-            iidx1, op_key1 = insn_op1
-            iidx2, op_key2 = insn_op2
+            # Most entries are TOP and carry no constraint, so they are
+            # skipped before looking at the operand schemes.
+            val = should_alias._val
+            if val is not True and val is not False:
+                continue
+
             # Do not enter information for operands that are not present.
-            op_scheme1 = insn_schemes[iidx1].get_operand_scheme(op_key1)
-            op_scheme2 = insn_schemes[iidx2].get_operand_scheme(op_key2)
+            op_scheme1 = op_scheme_table.get(insn_op1, None)
+            op_scheme2 = op_scheme_table.get(insn_op2, None)
             if (op_scheme1 is None or op_scheme2 is None):
                 continue
 
-            if (self.actx.iwho_augmentation.skip_for_aliasing(op_scheme1) or
-                    self.actx.iwho_augmentation.skip_for_aliasing(op_scheme1)):
+            if skip_for_aliasing(op_scheme1) or skip_for_aliasing(op_scheme2):
                 # we also don't want this information if we skip the operand scheme
                 continue
 
             # if operand schemes are not compatible, this entry is ignored
-            if not self.actx.iwho_augmentation.is_compatible(op_scheme1, op_scheme2):
+            if not is_compatible(op_scheme1, op_scheme2):
+                continue
+
+            if val:
+                uf.union(get_op_id(insn_op1), get_op_id(insn_op2))
+            else:
+                not_same_pairs.append((get_op_id(insn_op1), get_op_id(insn_op2)))
+
+        if len(op_refs) == 0:
+            # no applicable constraints, which is the common case
+            return dict(), dict()
+
+        find = uf.find
+
+        # lift the not_same constraints to the equivalence classes
+        class_not_same = defaultdict(set)
+        for id1, id2 in not_same_pairs:
+            r1 = find(id1)
+            r2 = find(id2)
+            if r1 == r2:
+                raise SamplingError(f"inconsistent aliasing constraints for {op_refs[id1]}!")
+            class_not_same[r1].add(r2)
+            class_not_same[r2].add(r1)
+
+        # translate the classes back to operand indices (only where needed,
+        # most operands are alone in their class and without constraints)
+        classes = uf.classes()
+        class_members = dict()
+        def get_members(r):
+            res = class_members.get(r, None)
+            if res is None:
+                res = { op_refs[i] for i in classes[r] }
+                class_members[r] = res
+            return res
+
+        same = dict()
+        for r, ids in classes.items():
+            if len(ids) < 2:
                 continue
+            members = get_members(r)
+            for m in members:
+                same[m] = members - {m}
+
+        not_same = dict()
+        for r, other_roots in class_not_same.items():
+            entry = set()
+            for other_r in other_roots:
+                entry.update(get_members(other_r))
+            for m in get_members(r):
+                not_same[m] = entry
+
+        return same, not_same
+
+    @staticmethod
+    def _compute_op_scheme_table(insn_schemes, operand_infos=None):
+        """ Return a mapping from op_indices to the corresponding operand
+        schemes of insn_schemes.
+
+        If the `operand_infos` for the insn_schemes (as computed by
+        `_compute_operand_infos`) are given, they are used instead of
+        iterating over the operands of the insn_schemes again.
+
+        Helper function for sampling.
+        """
+        if operand_infos is not None:
+            return { (iidx, info[0]): info[1]
+                    for iidx, infos in enumerate(operand_infos)
+                        for info in infos }
+        return { (iidx, op_key): op_scheme
+                for iidx, ischeme in enumerate(insn_schemes)
+                    for op_key, op_scheme in ischeme.operand_keys }
+
+    def _compute_operand_infos(self, insn_schemes):
+        """ Collect the properties of the operand schemes of insn_schemes that
+        are relevant for sampling.
 
-            if should_alias.val is True:
-                same[insn_op1].add(insn_op2)
-                same[insn_op2].add(insn_op1)
-            elif should_alias.val is False:
-                not_same[insn_op1].add(insn_op2)
-                not_same[insn_op2].add(insn_op1)
-
-        # extend the same mapping to its transitive closure
-        _transitive_closure(same)
-
-        # use same's transitive closure to extend not_same
-        closed_not_same = defaultdict(set)
-        for k, vs in not_same.items():
-            entry_for_k = set(vs)
-            for v in vs:
-                entry_for_k.update(same[v])
-            if k in entry_for_k:
-                raise SamplingError(f"inconsistent aliasing constraints for {k}!")
-            closed_not_same[k] = entry_for_k
-            for ok in same[k]:
-                if ok in entry_for_k:
-                    raise SamplingError(f"inconsistent aliasing constraints for {ok}!")
-                closed_not_same[ok] = entry_for_k
-
-        return same, closed_not_same
-
-    def _choose_fixed_operands(self, chosen_operands, insn_schemes, same, not_same):
+        Returns a list with the `IWHOAugmentation.operand_infos` for each
+        InsnScheme.
+
+        Helper function for sampling.
+        """
+        operand_infos = self.actx.iwho_augmentation.operand_infos
+        return [ operand_infos(ischeme) for ischeme in insn_schemes ]
+
+    def _choose_fixed_operands(self, chosen_operands, insn_schemes, operand_infos, op_scheme_table, same, not_same):
         """ Go through all insn_schemes and pin each fixed operand.
 
         Results are entered into the chosen_operands dict, which is also
@@ -1126,8 +1708,8 @@ class AbstractAliasInfo(Expandable):
         ctx = self.actx.iwho_ctx
 
         for iidx, ischeme in enumerate(insn_schemes):
-            for op_key, op_scheme in ischeme.operand_keys:
-                if self.actx.iwho_augmentation.skip_for_aliasing(op_scheme) or not op_scheme.is_fixed():
+            for op_key, op_scheme, skip, is_fixed, allowed in operand_infos[iidx]:
+                if skip or not is_fixed:
                     continue
                 idx = (iidx, op_key)
                 fixed_op = op_scheme.fixed_operand
@@ -1147,11 +1729,11 @@ class AbstractAliasInfo(Expandable):
 
                 # for all operands that are supposed to alias, choose an
                 # appropriate operand as well
-                for k in same[idx]:
+                for k in same.get(idx, ()):
                     # try to find an adjusted version of the fixed operand that
                     # works for this operand (usually, this would do nothing or
                     # change the operand width).
-                    adjusted_fixed_op = ctx.adjust_operand(fixed_op, insn_schemes[k[0]].get_operand_scheme(k[1]))
+                    adjusted_fixed_op = ctx.adjust_operand(fixed_op, op_scheme_table[k])
                     if adjusted_fixed_op is None:
                         raise SamplingError(f"InsnScheme {insn_schemes[k[0]]} requires an incompatible operand for {k[1]} from aliasing with a fixed operand: {fixed_op}")
 
@@ -1166,7 +1748,7 @@ class AbstractAliasInfo(Expandable):
         # If we did, those InsnSchemes are not suitable for sampling with this
         # aliasing info.
         for k, v in chosen_operands.items():
-            for nk in not_same[k]:
+            for nk in not_same.get(k, ()):
                 nv = chosen_operands.get(nk)
                 if nv is None:
                     continue
@@ -1175,75 +1757,244 @@ class AbstractAliasInfo(Expandable):
 
         return chosen_operands
 
-    def _choose_remaining_operands(self, chosen_operands, insn_schemes, same, not_same):
+    def _choose_remaining_operands(self, chosen_operands, insn_schemes, operand_infos, op_scheme_table, same, not_same):
         """ Choose/sample fitting operands for the insn_schemes that are not
         yet specified by chosen_operands.
 
+        Operands that need to alias are chosen together. The groups of such
+        operands are chosen in the order of how many options they have left
+        (fewest first), and every choice immediately removes options for the
+        groups that must not alias with it.
+        If a group runs out of options, the choices are undone up to the most
+        recent one that removed options from the group (conflict-directed
+        backjumping), at most `max_backjumps` times.
+
         The result is entered into chosen_operands, which is also returned.
 
         Helper function for sampling.
         """
-        # in here, backtracking would be necessary
-
-        ctx = self.actx.iwho_ctx
+        adjust_operand = self.actx.iwho_ctx.adjust_operand
+        may_alias = self.actx.iwho_augmentation.may_alias
+
+        # formatting the debug messages is not free, so we only do it if they
+        # are actually logged
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Groups of operands that are chosen together, identified by their
+        # index in the following lists. The operand of the first member is
+        # taken from the domain, the others are adjusted from it. The domain
+        # is always a subset of the (shared) tuple of allowed operands in
+        # `bases`.
+        members = []
+        domains = []
+        bases = []
+        group_of = dict()
 
         for iidx, ischeme in enumerate(insn_schemes):
-            for op_key, op_scheme in ischeme.operand_keys:
+            for op_key, op_scheme, skip, is_fixed, allowed_operands in operand_infos[iidx]:
                 idx = (iidx, op_key)
                 # we already chose an operand here
                 if chosen_operands.get(idx, None) is not None:
                     continue
 
-                allowed_operands = set(self.actx.iwho_augmentation.allowed_operands(op_scheme))
-                if not self.actx.iwho_augmentation.skip_for_aliasing(op_scheme):
-
-                    # collect all opschemes that need to have an aliasing
-                    # operand and collect all already selected operands that
-                    # are not allowed to alias
-                    same_opschemes = []
-                    notsame_operands = set()
-                    for k in itertools.chain((idx,), same[idx]):
-                        same_opschemes.append(insn_schemes[k[0]].get_operand_scheme(k[1]))
+                if skip:
+                    # no aliasing constraints apply here, so we can just
+                    # choose one
+                    if len(allowed_operands) == 0:
+                        raise SamplingError(f"InsnScheme {ischeme} has no allowed operands left for operand '{op_key}' ({op_scheme})")
+                    chosen = allowed_operands[random.randrange(len(allowed_operands))]
+                    chosen_operands[idx] = chosen
+                    if log_debug:
+                        logger.debug(f"choose {idx} -> {chosen}")
+                    continue
 
-                        for inner_k in not_same[k]:
-                            already_chosen = chosen_operands.get(inner_k, None)
-                            if already_chosen is not None:
-                                notsame_operands.add(already_chosen)
+                if idx in group_of:
+                    # this operand is chosen together with an earlier one
+                    continue
 
-                    # Remove operands that can't be used in all `same` operands
-                    ruled_out_by_same_constraints = []
-                    for ao in allowed_operands:
-                        for curr_opscheme in same_opschemes:
-                            ao_adjusted = ctx.adjust_operand(ao, curr_opscheme)
-                            if ao_adjusted is None:
-                                ruled_out_by_same_constraints.append(ao)
-                    allowed_operands.difference_update(ruled_out_by_same_constraints)
-
-                    # Remove operands that are already used as `notsame` operands
-                    ruled_out_by_notsame_constraints = []
+                group_members = [idx]
+                group_members.extend(same.get(idx, ()))
+
+                same_opschemes = [ op_scheme_table[k] for k in group_members[1:] ]
+
+                # collect all already selected operands that are not allowed
+                # to alias
+                notsame_operands = set()
+                for k in group_members:
+                    for inner_k in not_same.get(k, ()):
+                        already_chosen = chosen_operands.get(inner_k, None)
+                        if already_chosen is not None:
+                            notsame_operands.add(already_chosen)
+
+                if len(same_opschemes) == 0 and len(notsame_operands) == 0:
+                    # nothing to filter, the shared tuple of allowed operands
+                    # is only copied below if the domain can shrink
+                    domain = allowed_operands
+                else:
+                    # Keep only operands that can be used in all `same`
+                    # operands and that don't alias with the `notsame`
+                    # operands
+                    domain = set()
                     for ao in allowed_operands:
-                        for curr_operand in notsame_operands:
-                            if self.actx.iwho_augmentation.may_alias(ao, curr_operand):
-                                ruled_out_by_notsame_constraints.append(ao)
-                    allowed_operands.difference_update(ruled_out_by_notsame_constraints)
-
-                if len(allowed_operands) == 0:
-                    raise SamplingError(f"InsnScheme {ischeme} has no allowed operands left for operand '{op_key}' ({op_scheme})")
-
-                # choose one from the allowed_operands
-                chosen = random.choice(list(allowed_operands))
-                chosen_operands[idx] = chosen
-                logger.debug(f"choose {idx} -> {chosen}")
-
-                if not self.actx.iwho_augmentation.skip_for_aliasing(op_scheme):
-                    # also choose this one for the entries in the same set
-                    # If the same/not_same sets do not describe a valid
-                    # partition, this could ignore an inconsistent constraint.
-                    for k in same[idx]:
-                        chosen_operand = ctx.adjust_operand(chosen, insn_schemes[k[0]].get_operand_scheme(k[1]))
-                        assert chosen_operand is not None, "This should have been ruled out by the above `ruled_out_by_` code!"
-                        chosen_operands[k] = chosen_operand
-                        logger.debug(f"choose {k} -> {chosen}")
+                        if any(adjust_operand(ao, os) is None for os in same_opschemes):
+                            continue
+                        if any(may_alias(ao, co) for co in notsame_operands):
+                            continue
+                        domain.add(ao)
+
+                gidx = len(members)
+                members.append(group_members)
+                domains.append(domain)
+                bases.append(allowed_operands)
+                for k in group_members:
+                    group_of[k] = gidx
+
+        def fail_msg(gidx):
+            iidx, op_key = members[gidx][0]
+            ischeme = insn_schemes[iidx]
+            op_scheme = op_scheme_table[(iidx, op_key)]
+            return f"InsnScheme {ischeme} has no allowed operands left for operand '{op_key}' ({op_scheme})"
+
+        num_groups = len(members)
+
+        # for each group: the groups that must not alias with it
+        neighbors = []
+        for gidx in range(num_groups):
+            ns = set()
+            for k in members[gidx]:
+                for nk in not_same.get(k, ()):
+                    other = group_of.get(nk, None)
+                    if other is not None and other != gidx:
+                        ns.add(other)
+            neighbors.append(ns)
+
+        num_rejection_attempts = self.num_rejection_attempts
+
+        def pick(gidx):
+            domain = domains[gidx]
+            base = bases[gidx]
+            num_base = len(base)
+            if domain is base:
+                return base[random.randrange(num_base)]
+            if 2 * len(domain) >= num_base:
+                # Most allowed operands are still available, so rejection
+                # sampling from the shared tuple is cheaper than building a
+                # new sequence. The result is uniformly distributed over the
+                # domain either way.
+                for i in range(num_rejection_attempts):
+                    candidate = base[random.randrange(num_base)]
+                    if candidate in domain:
+                        return candidate
+            options = tuple(domain)
+            return options[random.randrange(len(options))]
+
+        def choose(gidx):
+            chosen = pick(gidx)
+            chosen_ops = [chosen]
+            for k in members[gidx][1:]:
+                chosen_operand = adjust_operand(chosen, op_scheme_table[k])
+                assert chosen_operand is not None, "This should have been ruled out when computing the allowed operands!"
+                chosen_ops.append(chosen_operand)
+            return chosen_ops
+
+        # the operands chosen for each group's members (None if unassigned)
+        assignment = [None] * num_groups
+
+        unassigned = set()
+        for gidx in range(num_groups):
+            domain = domains[gidx]
+            if len(neighbors[gidx]) > 0:
+                if not isinstance(domain, set):
+                    domains[gidx] = set(domain)
+                unassigned.add(gidx)
+                continue
+            # No other choice can remove options of a group without
+            # neighbors, so we choose for it right away.
+            if len(domain) == 0:
+                raise SamplingError(fail_msg(gidx))
+            assignment[gidx] = choose(gidx)
+
+        # the stack of assigned groups, in order of assignment
+        stack = []
+        # for each assigned group: which options it removed from which group
+        trails = [None] * num_groups
+        # for each group: the groups whose choices (might have) removed options
+        conflicts = [ set() for gidx in range(num_groups) ]
+        # for each group: options that were already tried without success
+        tried = [ set() for gidx in range(num_groups) ]
+
+        num_backjumps = 0
+        while len(unassigned) > 0:
+            # choose the group with the fewest remaining options
+            gidx = min(unassigned, key=lambda g: (len(domains[g]), g))
+            failed = None
+
+            if len(domains[gidx]) == 0:
+                failed = gidx
+            else:
+                chosen_ops = choose(gidx)
+
+                assignment[gidx] = chosen_ops
+                unassigned.discard(gidx)
+                stack.append(gidx)
+
+                # rule out options for groups that must not alias with this one
+                trail = []
+                for other in neighbors[gidx]:
+                    if assignment[other] is not None:
+                        continue
+                    removed = { ao for ao in domains[other] if any(may_alias(ao, op) for op in chosen_ops) }
+                    if len(removed) == 0:
+                        continue
+                    domains[other].difference_update(removed)
+                    trail.append((other, removed))
+                    conflicts[other].add(gidx)
+                    if len(domains[other]) == 0:
+                        failed = other
+                        break
+                trails[gidx] = trail
+
+            if failed is None:
+                continue
+
+            # Some group has no options left. Jump back to the most recent
+            # choice that might have caused this, or fail if there is none.
+            culprits = { c for c in conflicts[failed] if assignment[c] is not None }
+            if len(culprits) == 0 or num_backjumps >= self.max_backjumps:
+                raise SamplingError(fail_msg(failed))
+            num_backjumps += 1
+
+            while True:
+                undone = stack.pop()
+                bad_choice = assignment[undone][0]
+                for other, removed in trails[undone]:
+                    domains[other].update(removed)
+                trails[undone] = None
+                assignment[undone] = None
+                unassigned.add(undone)
+                if undone in culprits:
+                    break
+                # The choices for groups that we jump over are reconsidered
+                # from scratch.
+                domains[undone].update(tried[undone])
+                tried[undone] = set()
+                conflicts[undone] = set()
+
+            if log_debug:
+                logger.debug(f"backjump to group {members[undone][0]} after failing at {members[failed][0]}")
+
+            # Don't retry the failed choice, and remember that the reasons for
+            # the failure are now reasons for this group's limited options.
+            domains[undone].discard(bad_choice)
+            tried[undone].add(bad_choice)
+            conflicts[undone].update(culprits)
+            conflicts[undone].discard(undone)
+
+        for gidx in range(num_groups):
+            for k, op in zip(members[gidx], assignment[gidx]):
+                chosen_operands[k] = op
+                if log_debug:
+                    logger.debug(f"choose {k} -> {op}")
 
         return chosen_operands
 
@@ -1252,16 +2003,22 @@ class AbstractAliasInfo(Expandable):
         the aliasing constraints represented by self are not violated.
 
         Raises a SamplingError if this fails (which might happen due to
-        contradicting constraints or because this implementation does not
-        backtrack wrong sampling decisions).
+        contradicting constraints or because this implementation only
+        backtracks a bounded number of wrong sampling decisions).
         """
         if self.is_bot:
             raise SamplingError(f"Trying to sample a basic block with BOTTOM as aliasing information")
 
-        logger.debug("sampling operands for these InsnSchemes:\n" + textwrap.indent("\n".join(map(str, insn_schemes)), '  '))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("sampling operands for these InsnSchemes:\n" + textwrap.indent("\n".join(map(str, insn_schemes)), '  '))
+        # the operands of each InsnScheme and their relevant properties are
+        # only collected once for all sampling steps
+        operand_infos = self._compute_operand_infos(insn_schemes)
+        op_scheme_table = self._compute_op_scheme_table(insn_schemes, operand_infos)
+
         # for each operand, determine which operands should and which ones
         # shouldn't alias
-        same, not_same = self._compute_partitions(insn_schemes)
+        same, not_same = self._compute_partitions(insn_schemes, op_scheme_table)
 
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("aliasing dict:\n" + textwrap.indent("\n".join(map(lambda x: "{}: {}".format(x[0], x[1]), self._aliasing_dict.items())), '  '))
@@ -1271,21 +2028,20 @@ class AbstractAliasInfo(Expandable):
         chosen_operands = dict()
 
         # go through all insn_schemes and pin each fixed operand
-        chosen_operands = self._choose_fixed_operands(chosen_operands, insn_schemes, same, not_same)
+        chosen_operands = self._choose_fixed_operands(chosen_operands, insn_schemes, operand_infos, op_scheme_table, same, not_same)
 
         # remaining unchosen operands are not determined by fixed operands
-        chosen_operands = self._choose_remaining_operands(chosen_operands, insn_schemes, same, not_same)
+        chosen_operands = self._choose_remaining_operands(chosen_operands, insn_schemes, operand_infos, op_scheme_table, same, not_same)
 
         # split the index of the chosen_operands mapping such that we can just
         # pass the inner dicts to InsnSchemes.instantate()
-        op_maps = defaultdict(dict)
+        op_maps = [ dict() for ischeme in insn_schemes ]
         for (iidx, op_key), chosen_operand in chosen_operands.items():
             op_maps[iidx][op_key] = chosen_operand
 
         # instantiate the schemes with the chosen operands
         bb = iwho.BasicBlock(self.actx.iwho_ctx)
-        for iidx, ischeme in enumerate(insn_schemes):
-            op_map = op_maps[iidx]
+        for ischeme, op_map in zip(insn_schemes, op_maps):
             try:
                 instance = ischeme.instantiate(op_map)
             except iwho.InstantiationError as e:
@@ -1302,6 +2058,8 @@ class AbstractBlock(Expandable):
     """ An instance of this class represents a set of (concrete) basic blocks.
     """
 
+    __slots__ = ('actx', 'abs_insns', 'abs_aliasing')
+
     def __init__(self, actx: "AbstractionContext", bb: iwho.BasicBlock):
         self.actx = actx
         self.abs_insns = [ ]
@@ -1378,9 +2136,17 @@ class AbstractBlock(Expandable):
         return res
 
     def __deepcopy__(self, memo):
-        new_one = AbstractBlock(self.actx, bb=None)
-        new_one.abs_insns = deepcopy(self.abs_insns, memo)
-        new_one.abs_aliasing = deepcopy(self.abs_aliasing, memo)
+        return self.copy()
+
+    def copy(self) -> "AbstractBlock":
+        """ Return an independent copy of this `AbstractBlock`.
+
+        This is equivalent to, but faster than `deepcopy`.
+        """
+        new_one = AbstractBlock.__new__(AbstractBlock)
+        new_one.actx = self.actx
+        new_one.abs_insns = [ ai.copy() for ai in self.abs_insns ]
+        new_one.abs_aliasing = self.abs_aliasing.copy()
         return new_one
 
     def get_possible_expansions(self):
@@ -1411,6 +2177,30 @@ class AbstractBlock(Expandable):
             inner_expansion = expansion[1]
             self.abs_aliasing.apply_expansion(inner_expansion)
 
+    def copy_with_expansion(self, expansion) -> "AbstractBlock":
+        """ Return a copy of `self` with the `expansion` applied.
+
+        This is equivalent to, but faster than copying `self` and applying the
+        expansion to the copy: Only the expanded component is copied, all
+        others are shared with `self`. Therefore, neither `self` nor the result
+        may be modified in place afterwards, except via further calls to this
+        method.
+        """
+        new_one = AbstractBlock.__new__(AbstractBlock)
+        new_one.actx = self.actx
+        new_one.abs_insns = list(self.abs_insns)
+        new_one.abs_aliasing = self.abs_aliasing
+
+        component = expansion[0]
+        if component == 0: # Insn component
+            key, inner_expansion = expansion[1:]
+            new_one.abs_insns[key] = self.abs_insns[key].copy_with_expansion(inner_expansion)
+        else: # Aliasing component
+            assert component == 1
+            inner_expansion = expansion[1]
+            new_one.abs_aliasing = self.abs_aliasing.copy_with_expansion(inner_expansion)
+        return new_one
+
     def __str__(self) -> str:
         def format_insn(x):
             idx, abs_insn = x
@@ -1430,6 +2220,9 @@ class AbstractBlock(Expandable):
         """ Check if all concrete basic blocks represented by other are also
         represented by self.
         """
+        if self is other:
+            return True
+
         # check if all abstract insns are subsumed
         for self_ai, other_ai in zip(self.abs_insns, other.abs_insns):
             if not self_ai.subsumes(other_ai):
@@ -1439,11 +2232,8 @@ class AbstractBlock(Expandable):
             # If other has more instructions than self, we need to check
             # whether one of the additional ones is not BOTTOM (since
             # non-present instructions are implicitly BOTTOM).
-            # Since AbstractInsn right now has no is_bottom() method and this
-            # case appears to be rather exotic, we use this hack here instead:
-            bottom = AbstractInsn(self.actx)
             for other_ai in other.abs_insns[len(self.abs_insns):]:
-                if not bottom.subsumes(other_ai):
+                if not other_ai.is_bottom():
                     return False
 
         return self.abs_aliasing.subsumes(other.abs_aliasing)
@@ -1537,7 +2327,7 @@ class AbstractBlock(Expandable):
 
 
         new_one.abs_insns = new_ais
-        new_one.abs_aliasing = deepcopy(self.abs_aliasing)
+        new_one.abs_aliasing = self.abs_aliasing.copy()
 
         return new_one
 
@@ -1547,8 +2337,18 @@ class PrecomputedSamplerAbsInsn:
     a pre-computed set of `iwho.InsnScheme`s.
     """
 
+    __slots__ = ('allowed_schemes',)
+
     def __init__(self, allowed_schemes):
         self.allowed_schemes = tuple(allowed_schemes)
 
+    def copy(self):
+        return PrecomputedSamplerAbsInsn(self.allowed_schemes)
+
     def sample(self, **kwargs) -> iwho.InsnScheme:
-        return random.choice(self.allowed_schemes)
+        allowed_schemes = self.allowed_schemes
+        num_allowed = len(allowed_schemes)
+        if num_allowed == 1:
+            # this is common for very specific AbstractInsns
+            return allowed_schemes[0]
+        return allowed_schemes[random.randrange(num_allowed)]
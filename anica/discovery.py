@@ -2,7 +2,6 @@
 """
 
 from typing import Optional, Sequence
-from copy import deepcopy
 from datetime import datetime, timedelta
 import math
 import os
@@ -279,12 +278,10 @@ def discover(actx: AbstractionContext, termination={}, start_point: Optional[Abs
 
                     gen_stat_entry['id'] = generalization_id
 
-                    working_bb = deepcopy(abstracted_bb)
-
                     remarks = [('generalization strategy: {}', curr_strategy) ]
 
                     start_generalization_time = datetime.now()
-                    generalized_bb, trace, last_result_ref = generalize(actx, working_bb, strategy=curr_strategy, remarks=remarks)
+                    generalized_bb, trace, last_result_ref = generalize(actx, abstracted_bb, strategy=curr_strategy, remarks=remarks)
 
                     generalization_time = ((datetime.now() - start_generalization_time) / timedelta(milliseconds=1)) / 1000
                     gen_stat_entry['generalization_time'] = generalization_time
@@ -418,9 +415,17 @@ def generalize(actx: AbstractionContext, abstract_bb: AbstractBlock, strategy: s
 
     This means that we try to adjust it such that it represents a maximal
     number of concrete blocks that are still mostly interesting.
+
+    The given `abstract_bb` is never modified, so callers do not need to pass
+    a copy.
     """
     generalization_batch_size = actx.discovery_cfg.generalization_batch_size
 
+    # The expanded blocks below share their unchanged components with their
+    # predecessors, so we work on our own copy of the given block. This copy
+    # (or an expansion of it) is also what we return, on every path.
+    abstract_bb = abstract_bb.copy()
+
     logger.info("  generalizing BB:" + textwrap.indent(str(abstract_bb), 4*' ') )
 
     trace = WitnessTrace(abstract_bb)
@@ -447,11 +452,8 @@ def generalize(actx: AbstractionContext, abstract_bb: AbstractBlock, strategy: s
     do_not_expand = set()
 
     while True:
-        # create a deepcopy to expand
-        working_copy = deepcopy(abstract_bb)
-
         # expand some component
-        expansions = working_copy.get_possible_expansions()
+        expansions = abstract_bb.get_possible_expansions()
 
         # don't use one that we already tried and failed
         expansions = [ (exp, benefit) for (exp, benefit) in expansions if exp not in do_not_expand ]
@@ -469,11 +471,12 @@ def generalize(actx: AbstractionContext, abstract_bb: AbstractBlock, strategy: s
             chosen_expansion, (benefit, definitely_does_not_change) = random.choice(expansions)
         elif strategy == "interactive":
             assert interact is not None
-            chosen_expansion, (benefit, definitely_does_not_change) = interact(working_copy, expansions)
+            chosen_expansion, (benefit, definitely_does_not_change) = interact(abstract_bb, expansions)
         else:
             assert False, f"unknown generalization strategy: {strategy}"
 
-        working_copy.apply_expansion(chosen_expansion)
+        # create an expanded copy, only the expanded component is duplicated
+        working_copy = abstract_bb.copy_with_expansion(chosen_expansion)
 
         if definitely_does_not_change:
             logger.info(f"  the chosen expansion {chosen_expansion} (benefit: {benefit}) cannot change the represented basic blocks, skipping interestingness evaluation")
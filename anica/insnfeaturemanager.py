@@ -142,13 +142,29 @@ class InsnFeatureManager(metaclass=ConfigMeta):
 
         self.index_order = [ key for key, kind in self.features if key not in self.not_indexed ]
         self.feature_indices = dict()
+
+        # A cache for the results of `extract_features()`, keyed by the
+        # InsnScheme. This is filled while building the index already.
+        self._features_cache = dict()
+
         self._build_index()
 
+        # the result for AbstractInsns without constraints
+        self.all_schemes = frozenset(self.iwho_ctx.filtered_insn_schemes)
+
         # A per-feature index mapping concrete string features s to a list of
         # concrete features with their editing distance from s.
         # We build that one on demand with `get_editdists()`.
         self.editdist_indices = dict()
 
+        # A cache for the results of `lookup()`, keyed by the feature key and
+        # the state key of the abstract feature.
+        self._lookup_cache = dict()
+
+        # A cache for the results of `get_feasible_schemes()`, keyed by the
+        # state keys of all indexed features.
+        self._feasible_schemes_cache = dict()
+
     def _build_index(self):
         """ Initialize the `InsnScheme` indices for each configured feature.
 
@@ -236,6 +252,18 @@ class InsnFeatureManager(metaclass=ConfigMeta):
         `absfeature_dict` is a dict mapping feature names to instances of
         `AbstractFeature`, like it is found in `AbstractInsn`.
         """
+        return set(self.get_feasible_schemes(absfeature_dict))
+
+    def get_feasible_schemes(self, absfeature_dict, ignored_key=None):
+        """ Like `compute_feasible_schemes()`, but return a frozenset that
+        might be shared with internal state.
+
+        This avoids copying the result where possible.
+
+        If `ignored_key` is given, the indexed feature with this key is
+        considered TOP. The result can then be restricted by different values
+        for this feature via `restrict_feasible_schemes()`.
+        """
         exact_scheme_entry = absfeature_dict.get('exact_scheme', None)
         if exact_scheme_entry is not None:
             # special handling for thsi one, because there is only one feasible
@@ -245,32 +273,84 @@ class InsnFeatureManager(metaclass=ConfigMeta):
                 # we could validate that the other features don't exclude this
                 # scheme, but that cannot be an issue as long as we only go up in
                 # the lattice
-                return {scheme}
+                return frozenset((scheme,))
+
+        # The same combinations of features occur for many AbstractInsns
+        # (e.g. in different AbstractBlocks or copies of them), so we remember
+        # the results by the states of the relevant features.
+        cache = self._feasible_schemes_cache
+        key = (ignored_key, tuple(absfeature_dict[k].state_key() for k in self.index_order if k != ignored_key))
+        res = cache.get(key, None)
+        if res is None:
+            if len(cache) >= self.lookup_cache_limit:
+                cache.clear()
+            res = self._compute_feasible_schemes(absfeature_dict, ignored_key)
+            cache[key] = res
+        return res
 
-        feasible_schemes = None
+    def _compute_feasible_schemes(self, absfeature_dict, ignored_key):
+        """ Compute the result for `get_feasible_schemes()` from the indexed
+        features.
+        """
+        lookups = []
 
         order = self.index_order
         for k in order:
+            if k == ignored_key:
+                continue
             v = absfeature_dict[k]
             if v.is_top():
                 continue
             if v.is_bottom():
-                return set()
-            feasible_schemes_for_feature = self.lookup(k, v)
-            if feasible_schemes is None:
-                feasible_schemes = set(feasible_schemes_for_feature)
-            else:
-                feasible_schemes.intersection_update(feasible_schemes_for_feature)
+                return frozenset()
+            lookups.append(self.lookup(k, v))
 
-        if feasible_schemes is None:
+        if len(lookups) == 0:
             # all features are TOP, no restriction
-            feasible_schemes = set(self.iwho_ctx.filtered_insn_schemes)
+            return self.all_schemes
+
+        # start with the smallest set to keep the intersections cheap
+        lookups.sort(key=len)
+        feasible_schemes = lookups[0]
+        for feasible_schemes_for_feature in lookups[1:]:
+            if len(feasible_schemes) == 0:
+                break
+            feasible_schemes = feasible_schemes & feasible_schemes_for_feature
 
         return feasible_schemes
 
+    def restrict_feasible_schemes(self, feasible_schemes, feature_key, value):
+        """ Return the frozenset of schemes from `feasible_schemes` that also
+        match the constraint implied by `value` on the indexed feature given by
+        `feature_key`.
+        """
+        if value.is_top():
+            return feasible_schemes
+        if value.is_bottom():
+            return frozenset()
+        return feasible_schemes & self.lookup(feature_key, value)
+
+    # The lookup caches are cleared when they grow larger than this.
+    lookup_cache_limit = 10000
+
     def lookup(self, feature_key, value):
-        """ Return a set of InsnSchemes that matches the constraint implied by
-        `value` on the feature given by `feature_key`.
+        """ Return a frozenset of InsnSchemes that matches the constraint
+        implied by `value` on the feature given by `feature_key`.
+
+        The result is cached.
+        """
+        cache = self._lookup_cache
+        key = (feature_key, value.state_key())
+        res = cache.get(key, None)
+        if res is None:
+            if len(cache) >= self.lookup_cache_limit:
+                cache.clear()
+            res = frozenset(self._compute_lookup(feature_key, value))
+            cache[key] = res
+        return res
+
+    def _compute_lookup(self, feature_key, value):
+        """ Compute the result for `lookup()`.
 
         If you want to implement new feature abstractions, you need to
         implement a case here, using an index computed in `_build_indices`.
@@ -352,8 +432,20 @@ class InsnFeatureManager(metaclass=ConfigMeta):
     def extract_features(self, ischeme: iwho.InsnScheme):
         """ Produce a dict with values for all configured features for the
         given `ischeme`.
+
+        The result is cached and shared between calls, it must not be
+        modified.
         """
         assert ischeme is not None
+        res = self._features_cache.get(ischeme, None)
+        if res is None:
+            res = self._compute_features(ischeme)
+            self._features_cache[ischeme] = res
+        return res
+
+    def _compute_features(self, ischeme: iwho.InsnScheme):
+        """ Compute the result for `extract_features()`.
+        """
         remaining_features = set(self.index_order)
 
         res = dict()
@@ -17,7 +17,36 @@ class IWHOAugmentation:
     def __init__(self, iwho_ctx: iwho.Context):
         self.iwho_ctx = iwho_ctx
 
+        # The methods below only depend on their (immutable) arguments and are
+        # queried very often when joining and sampling. Their results are
+        # cached here, keyed by the arguments.
+        self._compatible_cache = dict()
+        self._alias_classes_cache = dict()
+        self._must_alias_cache = dict()
+        self._may_alias_cache = dict()
+        self._alias_state_cache = dict()
+        self._skip_cache = dict()
+        self._allowed_operands_cache = dict()
+        self._operand_infos_cache = dict()
+        self._aliasing_operand_keys_cache = dict()
+
+    # The caches for aliasing queries on operands are cleared when they grow
+    # larger than this, since there might be arbitrarily many operands (e.g.
+    # immediates with different values).
+    alias_cache_limit = 100000
+
     def must_alias(self, op1: iwho.OperandInstance, op2: iwho.OperandInstance):
+        cache = self._must_alias_cache
+        key = (op1, op2)
+        res = cache.get(key, None)
+        if res is None:
+            if len(cache) >= self.alias_cache_limit:
+                cache.clear()
+            res = self._compute_must_alias(op1, op2)
+            cache[key] = res
+        return res
+
+    def _compute_must_alias(self, op1, op2):
         if isinstance(op1, iwho.x86.MemoryOperand) and isinstance(op2, iwho.x86.MemoryOperand):
             # we know that because of how we sample memory operands
             return op1.base == op2.base and op1.displacement == op2.displacement
@@ -28,6 +57,41 @@ class IWHOAugmentation:
         return self.iwho_ctx.must_alias(op1, op2)
 
     def may_alias(self, op1: iwho.OperandInstance, op2: iwho.OperandInstance):
+        cache = self._may_alias_cache
+        key = (op1, op2)
+        res = cache.get(key, None)
+        if res is None:
+            if len(cache) >= self.alias_cache_limit:
+                cache.clear()
+            res = self._compute_may_alias(op1, op2)
+            cache[key] = res
+        return res
+
+    def alias_state(self, op1: iwho.OperandInstance, op2: iwho.OperandInstance):
+        """ Return `True` if the operands must alias, `False` if they cannot
+        alias, and `None` otherwise.
+
+        This is what joining aliasing information needs, with a single cache
+        lookup instead of one for `must_alias` and one for `may_alias`.
+        """
+        cache = self._alias_state_cache
+        key = (op1, op2)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        if len(cache) >= self.alias_cache_limit:
+            cache.clear()
+        if self.must_alias(op1, op2):
+            res = True
+        elif not self.may_alias(op1, op2):
+            res = False
+        else:
+            res = None
+        cache[key] = res
+        return res
+
+    def _compute_may_alias(self, op1, op2):
         if isinstance(op1, iwho.x86.MemoryOperand) and isinstance(op2, iwho.x86.MemoryOperand):
             # we know that because of how we sample memory operands
             return op1.base == op2.base and op1.displacement == op2.displacement
@@ -38,31 +102,58 @@ class IWHOAugmentation:
         return self.iwho_ctx.may_alias(op1, op2)
 
     def is_compatible(self, op_scheme1, op_scheme2):
-        def extract_allowed_classes(op_scheme):
-            if op_scheme.is_fixed():
-                fixed_op = op_scheme.fixed_operand
-                if isinstance(fixed_op, iwho.x86.RegisterOperand):
-                    return {fixed_op.alias_class}
-                if isinstance(fixed_op, iwho.x86.MemoryOperand):
-                    return {"mem"}
-                return set()
-            op_constr = op_scheme.operand_constraint
-            if isinstance(op_constr, iwho.x86.RegisterConstraint):
-                return { x.alias_class for x in op_constr.acceptable_operands }
-            if isinstance(op_constr, iwho.x86.MemConstraint):
-                return {"mem"}
-            return set()
+        key = (op_scheme1, op_scheme2)
+        res = self._compatible_cache.get(key, None)
+        if res is None:
+            res = self._compute_is_compatible(op_scheme1, op_scheme2)
+            self._compatible_cache[key] = res
+        return res
 
-        allowed_classes1 = extract_allowed_classes(op_scheme1)
+    def _compute_is_compatible(self, op_scheme1, op_scheme2):
+        allowed_classes1 = self.alias_classes(op_scheme1)
 
-        allowed_classes2 = extract_allowed_classes(op_scheme2)
+        allowed_classes2 = self.alias_classes(op_scheme2)
 
         return not allowed_classes1.isdisjoint(allowed_classes2)
 
+    def alias_classes(self, op_scheme):
+        """ Return a frozenset of the classes of locations that operands for
+        the operand scheme can refer to.
+
+        Two operand schemes are compatible iff their alias classes intersect.
+        """
+        res = self._alias_classes_cache.get(op_scheme, None)
+        if res is None:
+            res = frozenset(self._compute_alias_classes(op_scheme))
+            self._alias_classes_cache[op_scheme] = res
+        return res
+
+    def _compute_alias_classes(self, op_scheme):
+        if op_scheme.is_fixed():
+            fixed_op = op_scheme.fixed_operand
+            if isinstance(fixed_op, iwho.x86.RegisterOperand):
+                return {fixed_op.alias_class}
+            if isinstance(fixed_op, iwho.x86.MemoryOperand):
+                return {"mem"}
+            return set()
+        op_constr = op_scheme.operand_constraint
+        if isinstance(op_constr, iwho.x86.RegisterConstraint):
+            return { x.alias_class for x in op_constr.acceptable_operands }
+        if isinstance(op_constr, iwho.x86.MemConstraint):
+            return {"mem"}
+        return set()
+
     def skip_for_aliasing(self, op_scheme):
         """ Return `True` if the operand scheme should not be considered for
         aliases.
         """
+        res = self._skip_cache.get(op_scheme, None)
+        if res is None:
+            res = self._compute_skip_for_aliasing(op_scheme)
+            self._skip_cache[op_scheme] = res
+        return res
+
+    def _compute_skip_for_aliasing(self, op_scheme):
         if op_scheme.is_fixed():
             operand = op_scheme.fixed_operand
             if isinstance(operand, iwho.x86.RegisterOperand):
@@ -103,7 +194,45 @@ class IWHOAugmentation:
         """ For an operand scheme, return operands that we can use in AnICA to
         instantiate them. They should be a subset of those allowed by the iwho
         constraints.
+
+        The result is a frozenset that is shared between calls.
+        """
+        res = self._allowed_operands_cache.get(op_scheme, None)
+        if res is None:
+            res = frozenset(self._compute_allowed_operands(op_scheme))
+            self._allowed_operands_cache[op_scheme] = res
+        return res
+
+    def operand_infos(self, insn_scheme):
+        """ For an InsnScheme, return a tuple with an entry
+        `(op_key, op_scheme, skip_for_aliasing, is_fixed, allowed_operands)`
+        for each of its operands, where `allowed_operands` is a tuple.
+
+        This collects what is necessary to sample operands for the InsnScheme.
+        The result is cached.
+        """
+        res = self._operand_infos_cache.get(insn_scheme, None)
+        if res is None:
+            res = tuple((op_key, op_scheme, self.skip_for_aliasing(op_scheme), op_scheme.is_fixed(), tuple(self.allowed_operands(op_scheme)))
+                    for op_key, op_scheme in insn_scheme.operand_keys)
+            self._operand_infos_cache[insn_scheme] = res
+        return res
+
+    def aliasing_operand_keys(self, insn_scheme):
+        """ For an InsnScheme, return a tuple with an entry
+        `(op_key, op_scheme)` for each of its operands that is not skipped for
+        aliasing.
+
+        The result is cached.
         """
+        res = self._aliasing_operand_keys_cache.get(insn_scheme, None)
+        if res is None:
+            res = tuple((op_key, op_scheme) for op_key, op_scheme in insn_scheme.operand_keys
+                    if not self.skip_for_aliasing(op_scheme))
+            self._aliasing_operand_keys_cache[insn_scheme] = res
+        return res
+
+    def _compute_allowed_operands(self, op_scheme):
         if op_scheme.is_fixed():
             return {op_scheme.fixed_operand}
         constraint = op_scheme.operand_constraint
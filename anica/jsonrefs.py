@@ -42,50 +42,82 @@ class JSONReferenceManager:
     def __init__(self, iwho_ctx):
         self.iwho_ctx = iwho_ctx
 
+        # The same references occur over and over in a typical json dict
+        # (e.g. the operand kinds in every aliasing key), so we remember
+        # their translations in both directions.
+        self._introduce_cache = dict()
+        self._resolve_cache = dict()
+
+    # Types of json values that never contain references. Most leaves of the
+    # dicts are of these types, so they are checked for first.
+    _plain_types = frozenset((str, int, float, bool, type(None)))
+
     def introduce_json_references(self, json_dict):
         """ Replace references to internal datatstructures in the json dict by
         unique identifiers.
         """
+        if type(json_dict) in self._plain_types:
+            return json_dict
         if isinstance(json_dict, tuple) or isinstance(json_dict, list):
-            return tuple((self.introduce_json_references(x) for x in json_dict))
+            introduce = self.introduce_json_references
+            return tuple([ introduce(x) for x in json_dict ])
         if isinstance(json_dict, dict):
-            return { k: self.introduce_json_references(x) for k,x in json_dict.items() }
-        if isinstance(json_dict, iwho.InsnScheme.OperandKind):
-            return f"$OperandKind:{json_dict.value}"
-        if isinstance(json_dict, iwho.InsnScheme):
-            return f"$InsnScheme:{str(json_dict)}"
-        if isinstance(json_dict, AbstractFeature.SpecialValue):
-            return f"$SV:{json_dict.name}"
+            introduce = self.introduce_json_references
+            return { k: introduce(x) for k,x in json_dict.items() }
+        if isinstance(json_dict, iwho.InsnScheme.OperandKind) or isinstance(json_dict, iwho.InsnScheme) or isinstance(json_dict, AbstractFeature.SpecialValue):
+            res = self._introduce_cache.get(json_dict, None)
+            if res is None:
+                res = self._introduce_reference(json_dict)
+                self._introduce_cache[json_dict] = res
+            return res
         return json_dict
 
+    @staticmethod
+    def _introduce_reference(obj):
+        if isinstance(obj, iwho.InsnScheme.OperandKind):
+            return f"$OperandKind:{obj.value}"
+        if isinstance(obj, iwho.InsnScheme):
+            return f"$InsnScheme:{str(obj)}"
+        assert isinstance(obj, AbstractFeature.SpecialValue)
+        return f"$SV:{obj.name}"
+
     def resolve_json_references(self, json_dict):
         """ Replace the unique identifiers introduced by
         `introduce_json_references` by references to internal datatstructures.
         """
         if isinstance(json_dict, tuple) or isinstance(json_dict, list):
-            return tuple((self.resolve_json_references(x) for x in json_dict))
+            resolve = self.resolve_json_references
+            return tuple([ resolve(x) for x in json_dict ])
         if isinstance(json_dict, dict):
-            return { k: self.resolve_json_references(x) for k,x in json_dict.items() }
+            resolve = self.resolve_json_references
+            return { k: resolve(x) for k,x in json_dict.items() }
         if isinstance(json_dict, str):
-            json_str = json_dict
-
-            search_str = '$InsnScheme:'
-            if json_str.startswith(search_str):
-                scheme_str = json_str[len(search_str):]
-                return self.iwho_ctx.str_to_scheme[scheme_str]
-
-            search_str = '$OperandKind:'
-            if json_str.startswith(search_str):
-                opkind_val = int(json_str[len(search_str):])
-                for ev in iwho.InsnScheme.OperandKind:
-                    if opkind_val == ev.value:
-                        return ev
-
-            search_str = '$SV:'
-            if json_str.startswith(search_str):
-                val = json_str[len(search_str):]
-                return AbstractFeature.SpecialValue[val]
-
-            return json_str
+            if not json_dict.startswith('$'):
+                return json_dict
+            res = self._resolve_cache.get(json_dict, None)
+            if res is None:
+                res = self._resolve_reference(json_dict)
+                self._resolve_cache[json_dict] = res
+            return res
         return json_dict
 
+    def _resolve_reference(self, json_str):
+        search_str = '$InsnScheme:'
+        if json_str.startswith(search_str):
+            scheme_str = json_str[len(search_str):]
+            return self.iwho_ctx.str_to_scheme[scheme_str]
+
+        search_str = '$OperandKind:'
+        if json_str.startswith(search_str):
+            opkind_val = int(json_str[len(search_str):])
+            for ev in iwho.InsnScheme.OperandKind:
+                if opkind_val == ev.value:
+                    return ev
+
+        search_str = '$SV:'
+        if json_str.startswith(search_str):
+            val = json_str[len(search_str):]
+            return AbstractFeature.SpecialValue[val]
+
+        return json_str
+
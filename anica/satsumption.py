@@ -14,6 +14,34 @@ from iwho import BasicBlock
 
 from .abstractblock import AbstractBlock, SamplingError
 
+def _has_complete_matching(candidates, num_nodes):
+    """ Check whether each of the nodes 0 to `num_nodes - 1` can be mapped to
+    a different one of its candidates, where `candidates` maps nodes to lists
+    of their candidates.
+
+    This is a necessary condition for the mappings encoded in the SAT problems
+    below, and much cheaper to check than solving them.
+    """
+    # maps candidates to the nodes that are currently mapped to them
+    mapped_to = dict()
+
+    def try_augment(node, visited):
+        # look for an augmenting path starting from node
+        for c in candidates[node]:
+            if c in visited:
+                continue
+            visited.add(c)
+            other = mapped_to.get(c, None)
+            if other is None or try_augment(other, visited):
+                mapped_to[c] = node
+                return True
+        return False
+
+    for node in range(num_nodes):
+        if not try_augment(node, set()):
+            return False
+    return True
+
 def check_subsumed_aa(ab1, ab2, print_assignment=False):
     """ Check whether ab2 represents all concrete blocks that ab1 represents
     (wrt the abstraction context).
@@ -21,8 +49,6 @@ def check_subsumed_aa(ab1, ab2, print_assignment=False):
     Both blocks must have the same abstraction context.
     """
 
-    actx = ab1.actx
-
     if len(ab1.abs_insns) < len(ab2.abs_insns):
         # Abstract blocks of different length can only be in a subsumption
         # relation if the shorter one subsumes the longer one.
@@ -39,7 +65,7 @@ def check_subsumed_aa(ab1, ab2, print_assignment=False):
     for ab in (ab1, ab2):
         feasible_sets = []
         for ai in ab.abs_insns:
-            fs = actx.insn_feature_manager.compute_feasible_schemes(ai.features)
+            fs = ai.get_feasible_schemes()
             feasible_sets.append(fs)
         both_feasible_sets.append(feasible_sets)
 
@@ -68,6 +94,10 @@ def check_subsumed_aa(ab1, ab2, print_assignment=False):
 
     cnf = CNFPlus()
 
+    if not _has_complete_matching(map_b2_idxs, len(ab2.abs_insns)):
+        # not even the feasible schemes allow an injective mapping
+        return False
+
     for idx_b2 in range(len(ab2.abs_insns)):
         vs = map_b2_vars[idx_b2]
         # We don't just iterate over the map_b2_vars.items() because those
@@ -188,7 +218,7 @@ def check_subsumed(bb: BasicBlock, ab: AbstractBlock, print_assignment=False, pr
         if precomputed_schemes is not None:
             feasible_schemes = precomputed_schemes[aidx]
         else:
-            feasible_schemes = actx.insn_feature_manager.compute_feasible_schemes(ai.features)
+            feasible_schemes = ai.get_feasible_schemes()
         for cidx, ci in enumerate(bb):
             if ci.scheme in feasible_schemes:
                 var = fresh_var()
@@ -199,6 +229,10 @@ def check_subsumed(bb: BasicBlock, ab: AbstractBlock, print_assignment=False, pr
                 map_c_idxs[cidx].append(aidx)
                 map_var_to_ac[var] = (aidx, cidx)
 
+    if not _has_complete_matching(map_a_idxs, len(ab.abs_insns)):
+        # not even the feasible schemes allow an injective mapping
+        return False
+
     for aidx, ai in enumerate(ab.abs_insns):
         vs = map_a_vars[aidx]
         if len(vs) == 0:
@@ -275,13 +309,11 @@ def check_subsumed(bb: BasicBlock, ab: AbstractBlock, print_assignment=False, pr
 
 
 def compute_coverage(ab, bb_sample, ratio=True):
-    actx = ab.actx
-
     # Without this, we would compute the same feasible schemes for all concrete
     # bbs, which is quite expensive.
     precomputed_schemes = []
     for ai in ab.abs_insns:
-        precomputed_schemes.append(actx.insn_feature_manager.compute_feasible_schemes(ai.features))
+        precomputed_schemes.append(ai.get_feasible_schemes())
 
     num_covered = 0
     for bb in bb_sample:
@@ -330,8 +362,6 @@ def check_subsumed_aa_arbitrary_order(ab1, ab2, print_assignment=False):
     Both blocks must have the same abstraction context.
     """
 
-    actx = ab1.actx
-
     if len(ab1.abs_insns) < len(ab2.abs_insns):
         # Abstract blocks of different length can only be in a subsumption
         # relation if the shorter one subsumes the longer one.
@@ -348,7 +378,7 @@ def check_subsumed_aa_arbitrary_order(ab1, ab2, print_assignment=False):
     for ab in (ab1, ab2):
         feasible_sets = []
         for ai in ab.abs_insns:
-            fs = actx.insn_feature_manager.compute_feasible_schemes(ai.features)
+            fs = ai.get_feasible_schemes()
             feasible_sets.append(fs)
         both_feasible_sets.append(feasible_sets)
 
@@ -377,6 +407,10 @@ def check_subsumed_aa_arbitrary_order(ab1, ab2, print_assignment=False):
 
     cnf = CNFPlus()
 
+    if not _has_complete_matching(map_b2_idxs, len(ab2.abs_insns)):
+        # not even the feasible schemes allow an injective mapping
+        return False
+
     for idx_b2 in range(len(ab2.abs_insns)):
         vs = map_b2_vars[idx_b2]
         # We don't just iterate over the map_b2_vars.items() because those
@@ -471,7 +505,7 @@ def check_subsumed_arbitrary_order(bb: BasicBlock, ab: AbstractBlock, print_assi
         if precomputed_schemes is not None:
             feasible_schemes = precomputed_schemes[aidx]
         else:
-            feasible_schemes = actx.insn_feature_manager.compute_feasible_schemes(ai.features)
+            feasible_schemes = ai.get_feasible_schemes()
         for cidx, ci in enumerate(bb):
             if ci.scheme in feasible_schemes:
                 var = fresh_var()
@@ -482,6 +516,10 @@ def check_subsumed_arbitrary_order(bb: BasicBlock, ab: AbstractBlock, print_assi
                 map_c_idxs[cidx].append(aidx)
                 map_var_to_ac[var] = (aidx, cidx)
 
+    if not _has_complete_matching(map_a_idxs, len(ab.abs_insns)):
+        # not even the feasible schemes allow an injective mapping
+        return False
+
     for aidx, ai in enumerate(ab.abs_insns):
         vs = map_a_vars[aidx]
         if len(vs) == 0:
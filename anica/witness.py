@@ -4,7 +4,6 @@ trace expansions performed in an AnICA generalization.
 These traces can be visualized in the AnICA UI.
 """
 
-from copy import deepcopy
 import json
 from typing import Optional
 
@@ -46,7 +45,7 @@ class WitnessTrace:
             return WitnessTrace.Witness(**json_dict)
 
     def __init__(self, abs_block):
-        self.start = deepcopy(abs_block)
+        self.start = abs_block.copy()
         self.trace = []
 
     def __len__(self):
@@ -91,14 +90,14 @@ class WitnessTrace:
         else:
             trace = self.trace[:index]
 
-        res = deepcopy(self.start)
+        res = self.start.copy()
         for witness in trace:
             if witness.terminate:
                 break
             if not witness.taken:
                 continue
             if validate:
-                check_tmp = deepcopy(res)
+                check_tmp = res.copy()
             res.apply_expansion(witness.expansion)
             if validate:
                 assert res.subsumes(check_tmp)
@@ -111,14 +110,14 @@ class WitnessTrace:
         `AbstractBlock` candidates. If `taken_only` is `True`, skip all
         rejected candidates.
         """
-        res = deepcopy(self.start)
+        res = self.start.copy()
         for witness in self.trace:
             if witness.terminate:
                 return
             if taken_only and not witness.taken:
                 continue
             if not witness.taken:
-                prev_res = deepcopy(res)
+                prev_res = res.copy()
             res.apply_expansion(witness.expansion)
 
             yield (witness, res)
@@ -197,7 +196,7 @@ class WitnessTrace:
                     fontname='Monospace',
                     color=color)
 
-        abb = deepcopy(self.start)
+        abb = self.start.copy()
 
         parent = new_node()
         abb_node(g, parent, abb, color="blue")
@@ -216,7 +215,7 @@ class WitnessTrace:
                 g.edge(parent, next_node)
                 parent = next_node
             else:
-                tmp_abb = deepcopy(abb)
+                tmp_abb = abb.copy()
                 tmp_abb.apply_expansion(witness.expansion)
                 abb_node(g, next_node, tmp_abb, color="#f00000", comment="Not Interesting (cf. exp series #{})".format(witness.measurements))
                 g.edge(parent, next_node)
@@ -13,7 +13,7 @@ import iwho
 import_path = os.path.join(os.path.dirname(__file__), "..")
 sys.path.append(import_path)
 
-from anica.abstractblock import AbstractBlock, SamplingError
+from anica.abstractblock import AbstractBlock, EditDistanceAbstractFeature, LogUpperBoundAbstractFeature, SingletonAbstractFeature, SubSetAbstractFeature, SubSetOrDefinitelyNotAbstractFeature, SamplingError
 from anica.abstractioncontext import AbstractionContext
 
 from test_utils import *
@@ -697,6 +697,37 @@ def test_deepcopy(random, actx):
     assert ab.subsumes(new_ab)
 
 
+def test_copy_independent(random, actx):
+    bb = make_bb(actx, "add rax, 0x2a\nsub ebx, eax")
+    ab = AbstractBlock(actx, bb)
+    ab_str = str(ab)
+
+    for ex, b in ab.get_possible_expansions():
+        new_ab = ab.copy()
+        assert new_ab == ab
+
+        new_ab.apply_expansion(ex)
+
+        # expanding the copy must not affect the original
+        assert new_ab != ab
+        assert str(ab) == ab_str
+
+
+def test_copy_with_expansion(random, actx):
+    bb = make_bb(actx, "add rax, 0x2a\nsub ebx, eax")
+    ab = AbstractBlock(actx, bb)
+    ab_str = str(ab)
+
+    for ex, b in ab.get_possible_expansions():
+        ref_ab = ab.copy()
+        ref_ab.apply_expansion(ex)
+
+        new_ab = ab.copy_with_expansion(ex)
+
+        assert new_ab == ref_ab
+        assert str(ab) == ab_str
+
+
 def test_expand_subsumes(random, actx):
     bb = make_bb(actx, "add rax, 0x2a\nsub ebx, eax")
     ab = AbstractBlock(actx, bb)
@@ -830,3 +861,39 @@ def test_log_ub_feature(actx_complex):
 
     ab.sample()
 
+
+
+def test_editdistance_feature_join():
+    feature = EditDistanceAbstractFeature(max_dist=2)
+    feature.join("add")
+    assert feature.curr_dist == 0
+
+    feature.join("adc")
+    assert feature.curr_dist == 1
+    assert not feature.is_top()
+
+    # a larger difference in length than max_dist can only mean TOP
+    feature.join("addsubpd")
+    assert feature.is_top()
+
+
+@pytest.mark.parametrize("make_feature,value", [
+        (lambda: EditDistanceAbstractFeature(max_dist=2), "add"),
+        (lambda: LogUpperBoundAbstractFeature(max_ub=5), [0, 1]),
+        (SingletonAbstractFeature, "add"),
+        (SubSetAbstractFeature, {'R'}),
+        (SubSetOrDefinitelyNotAbstractFeature, {'R'}),
+    ])
+def test_feature_flags(make_feature, value):
+    # Every feature needs to maintain its own TOP/BOTTOM flags, they are read
+    # directly on hot paths.
+    feature = make_feature()
+    assert feature._is_bottom and not feature._is_top
+
+    feature.join(value)
+    assert not feature._is_bottom and not feature._is_top
+    assert not feature.copy()._is_bottom
+
+    feature.set_to_top()
+    assert feature._is_top and not feature._is_bottom
+    assert feature.copy()._is_top
@@ -14,7 +14,7 @@ sys.path.append(import_path)
 from anica.abstractblock import AbstractBlock
 from anica.abstractioncontext import AbstractionContext
 
-from anica.satsumption import check_subsumed, check_subsumed_aa, check_subsumed_arbitrary_order, check_subsumed_aa_arbitrary_order
+from anica.satsumption import check_subsumed, check_subsumed_aa, check_subsumed_arbitrary_order, check_subsumed_aa_arbitrary_order, _has_complete_matching
 
 from test_utils import *
 
@@ -404,3 +404,19 @@ def test_satsumption_aa_fixed_order_08(random, actx):
     assert check_subsumed_aa_arbitrary_order(ab1, ab2)
     assert check_subsumed_aa(ab1, ab2)
 
+
+def test_satsumption_too_few_candidates(random, actx):
+    # Both abstract insns can only be mapped to the single add instruction.
+    bb1 = make_bb(actx, "add rax, 0x2a\nadd rax, 0x2a")
+    ab = AbstractBlock(actx, bb1)
+
+    bb2 = make_bb(actx, "add rax, 0x2a\nsub rbx, rax")
+    assert not check_subsumed(bb2, ab)
+    assert not check_subsumed_arbitrary_order(bb2, ab)
+
+def test_complete_matching():
+    assert _has_complete_matching({}, 0)
+    assert _has_complete_matching({0: [0, 1], 1: [0]}, 2)
+    assert not _has_complete_matching({0: [0], 1: [0]}, 2)
+    assert not _has_complete_matching({0: [0, 1], 1: [0, 1], 2: [1]}, 3)
+    assert _has_complete_matching({0: [0, 1, 2], 1: [0, 1], 2: [1]}, 3)